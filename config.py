@@ -3,23 +3,23 @@
 # Polling intervals (seconds)
 WINDOW_ENUMERATION_INTERVAL = 1.0
 
-# Window filtering settings
-EXCLUDED_WINDOW_CLASSES = [
+# Window filtering settings (frozensets for O(1) membership checks)
+EXCLUDED_WINDOW_CLASSES = frozenset({
     'Shell_TrayWnd',
     'DV2ControlHost',
     'MsgrIMEWindowClass',
     'SysShadow',
     'Button',
     'Windows.UI.Core.CoreWindow'
-]
+})
 
-EXCLUDED_WINDOW_TITLES = [
+EXCLUDED_WINDOW_TITLES = frozenset({
     'Program Manager',
     'Default IME',
     'MSCTFIME UI',
     'OpenBob - Watch Your Apps Live!',  # Exclude the tracker itself
     ''
-]
+})
 
 # Minimum window title length
 MIN_TITLE_LENGTH = 1
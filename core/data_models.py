@@ -1,10 +1,14 @@
 """Data models for window tracking."""
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Optional
 
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class WindowInfo:
     """Information about a tracked window."""
 
@@ -18,21 +22,20 @@ class WindowInfo:
     is_active: bool = False
     is_visible: bool = True
 
-    def update_times(self, interval: float, is_currently_active: bool):
+    def update_times(self, interval: timedelta, now: datetime, is_currently_active: bool):
         """Update time tracking for this window.
 
         Args:
-            interval: Time interval in seconds since last update
+            interval: Time elapsed since last update
+            now: Current time (shared by all windows in a tick)
             is_currently_active: Whether this window is currently focused
         """
-        self.last_seen = datetime.now()
-        self.total_open_time = datetime.now() - self.first_seen
+        self.last_seen = now
+        self.total_open_time = now - self.first_seen
+        self.is_active = is_currently_active
 
         if is_currently_active:
-            self.active_time += timedelta(seconds=interval)
-            self.is_active = True
-        else:
-            self.is_active = False
+            self.active_time += interval
 
     def __hash__(self):
         """Make WindowInfo hashable by hwnd."""
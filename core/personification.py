@@ -1,5 +1,8 @@
 """Personification layer - maps real windows to people and activities in a house."""
+import itertools
 import random
+import sys
+from collections import OrderedDict
 from typing import Dict, Tuple
 
 # Friendly app names (executable → display name)
@@ -73,10 +76,10 @@ FRIENDLY_APP_NAMES = {
 }
 
 # Titles/prefixes to personify app names
-TITLES = [
+TITLES = (
     "Mr.", "Ms.", "Sir", "Lady", "Captain", "Dr.", "Professor",
     "Chief", "Master", "Madam", "Lord", "Dame"
-]
+)
 
 # Emojis to assign to different app types
 EMOJI_MAP = {
@@ -91,7 +94,7 @@ EMOJI_MAP = {
 }
 
 # Diverse human emojis for apps without specific icons
-DIVERSE_PEOPLE = [
+DIVERSE_PEOPLE = (
     # Various skin tones and genders
     "👨", "👩", "🧑",  # Light skin tone
     "👨🏻", "👩🏻", "🧑🏻",  # Light
@@ -108,59 +111,97 @@ DIVERSE_PEOPLE = [
     # Age diversity
     "🧒", "🧒🏻", "🧒🏼", "🧒🏽", "🧒🏾", "🧒🏿",  # Child
     "🧓", "🧓🏻", "🧓🏼", "🧓🏽", "🧓🏾", "🧓🏿",  # Older person
-]
+)
 
 # Map app types to house activities (generic, don't mention app names)
 ACTIVITY_MAPPINGS = {
     # Browsers
-    "chrome": ["reading on the couch", "relaxing in living room", "looking something up at kitchen table", "browsing on tablet in den"],
-    "firefox": ["reading in the den", "sitting at the desk", "looking at something on laptop"],
-    "edge": ["working in home office", "researching at desk", "reading at computer"],
-    "safari": ["browsing on laptop in bedroom", "looking at screen on couch"],
+    "chrome": ("reading on the couch", "relaxing in living room", "looking something up at kitchen table", "browsing on tablet in den"),
+    "firefox": ("reading in the den", "sitting at the desk", "looking at something on laptop"),
+    "edge": ("working in home office", "researching at desk", "reading at computer"),
+    "safari": ("browsing on laptop in bedroom", "looking at screen on couch"),
 
     # Social & Communication
-    "discord": ["chatting in bedroom", "talking on phone", "laughing at something funny"],
-    "slack": ["working quietly in home office", "typing messages at desk"],
-    "teams": ["on a call in study", "having a meeting in office"],
-    "zoom": ["on a video call", "meeting in home office"],
-    "skype": ["video calling relatives", "talking to friends"],
-    "messenger": ["texting in bedroom", "sending messages"],
+    "discord": ("chatting in bedroom", "talking on phone", "laughing at something funny"),
+    "slack": ("working quietly in home office", "typing messages at desk"),
+    "teams": ("on a call in study", "having a meeting in office"),
+    "zoom": ("on a video call", "meeting in home office"),
+    "skype": ("video calling relatives", "talking to friends"),
+    "messenger": ("texting in bedroom", "sending messages"),
 
     # Entertainment
-    "spotify": ["listening to music in bedroom", "humming along to music", "enjoying tunes in living room"],
-    "netflix": ["watching TV in living room", "relaxing with entertainment", "enjoying a show"],
-    "youtube": ["watching something on couch", "entertained in den"],
-    "vlc": ["watching something in living room", "enjoying media"],
-    "steam": ["playing games in bedroom", "having fun at computer", "gaming in den"],
-    "minecraft": ["playing in playroom", "building something creative", "having fun at desk"],
-    "roblox": ["playing in playroom", "creating in bedroom", "having fun"],
+    "spotify": ("listening to music in bedroom", "humming along to music", "enjoying tunes in living room"),
+    "netflix": ("watching TV in living room", "relaxing with entertainment", "enjoying a show"),
+    "youtube": ("watching something on couch", "entertained in den"),
+    "vlc": ("watching something in living room", "enjoying media"),
+    "steam": ("playing games in bedroom", "having fun at computer", "gaming in den"),
+    "minecraft": ("playing in playroom", "building something creative", "having fun at desk"),
+    "roblox": ("playing in playroom", "creating in bedroom", "having fun"),
 
     # Productivity
-    "word": ["writing at desk", "working on project in study", "typing in office"],
-    "excel": ["working with numbers at desk", "organizing at computer", "calculating in office"],
-    "powerpoint": ["preparing something in office", "working on project at desk"],
-    "outlook": ["checking messages at desk", "organizing in office", "planning at computer"],
-    "notepad": ["jotting notes at desk", "writing ideas down", "making a list"],
-    "code": ["working in home office", "concentrating at computer", "focused at desk"],
-    "vscode": ["working at desk", "typing away in office", "focused on project"],
-    "terminal": ["working at computer", "doing technical work at desk"],
+    "word": ("writing at desk", "working on project in study", "typing in office"),
+    "excel": ("working with numbers at desk", "organizing at computer", "calculating in office"),
+    "powerpoint": ("preparing something in office", "working on project at desk"),
+    "outlook": ("checking messages at desk", "organizing in office", "planning at computer"),
+    "notepad": ("jotting notes at desk", "writing ideas down", "making a list"),
+    "code": ("working in home office", "concentrating at computer", "focused at desk"),
+    "vscode": ("working at desk", "typing away in office", "focused on project"),
+    "terminal": ("working at computer", "doing technical work at desk"),
 
     # Utilities
-    "calculator": ["doing math at desk", "calculating in office", "working on numbers"],
-    "calendar": ["planning at desk", "organizing schedule", "checking dates"],
-    "photos": ["looking at photo albums", "organizing pictures", "browsing photos"],
-    "files": ["organizing in office", "looking for something", "tidying up files"],
-    "explorer": ["organizing in office", "searching for something"],
+    "calculator": ("doing math at desk", "calculating in office", "working on numbers"),
+    "calendar": ("planning at desk", "organizing schedule", "checking dates"),
+    "photos": ("looking at photo albums", "organizing pictures", "browsing photos"),
+    "files": ("organizing in office", "looking for something", "tidying up files"),
+    "explorer": ("organizing in office", "searching for something"),
 
     # Default
-    "default": ["busy at desk", "working on something", "focused at computer", "doing something at laptop"]
+    "default": ("busy at desk", "working on something", "focused at computer", "doing something at laptop")
 }
 
 # Rooms in the house
-ROOMS = [
+ROOMS = (
     "living room", "kitchen", "bedroom", "home office", "den",
     "playroom", "study", "dining room", "backyard patio", "garage workshop"
-]
+)
+
+# Intern the phrase tables (multi-word literals are not interned automatically)
+ACTIVITY_MAPPINGS = {key: tuple(map(sys.intern, activities)) for key, activities in ACTIVITY_MAPPINGS.items()}
+TITLES = tuple(map(sys.intern, TITLES))
+ROOMS = tuple(map(sys.intern, ROOMS))
+DIVERSE_PEOPLE = tuple(map(sys.intern, DIVERSE_PEOPLE))
+
+# Upper bound on remembered windows/names (least recently used are evicted)
+MAX_TRACKED_PERSONAS = 1024
+
+# Process label shown for every personified window
+_IN_THE_HOUSE = "in the house"
+
+# Keyword tables flattened once at import (dict order = match priority)
+_EMOJI_PATTERNS = tuple(EMOJI_MAP.items())
+_ACTIVITY_PATTERNS = tuple(ACTIVITY_MAPPINGS.items())
+
+
+def _find_first_match(patterns: Tuple[Tuple[str, object], ...], text: str):
+    """Find the value of the first pattern whose key occurs in text.
+
+    Args:
+        patterns: Ordered (key, value) pairs
+        text: Lowercase text to search
+
+    Returns:
+        Matched value, or None if no key occurs in text
+    """
+    for key, value in patterns:
+        if key in text:
+            return value
+    return None
+
+
+# Exact-key fast paths: what the substring scan yields for each bare key
+# (e.g. "vscode" resolves to the earlier "code" entry, as the scan would)
+_EMOJI_EXACT = {key: _find_first_match(_EMOJI_PATTERNS, key) for key in EMOJI_MAP}
+_ACTIVITY_EXACT = {key: _find_first_match(_ACTIVITY_PATTERNS, key) for key in ACTIVITY_MAPPINGS}
 
 
 class PersonificationManager:
@@ -168,11 +209,14 @@ class PersonificationManager:
 
     def __init__(self):
         """Initialize the personification manager."""
-        self._window_to_persona: Dict[int, Dict] = {}  # hwnd -> persona info
-        self._used_names: Dict[str, int] = {}  # Track name usage for uniqueness
+        self._window_to_persona: Dict[int, Tuple[str, str]] = OrderedDict()  # hwnd -> (name, emoji), LRU order
+        self._used_names: Dict[str, int] = OrderedDict()  # Track name usage for uniqueness, LRU order
         self._person_emoji_pool = list(DIVERSE_PEOPLE)  # Copy of diverse people pool
         random.shuffle(self._person_emoji_pool)  # Shuffle for variety
-        self._person_emoji_index = 0  # Current index in pool
+        self._person_emoji_iter = itertools.cycle(self._person_emoji_pool)  # Endless pool iterator
+        self._emoji_cache: Dict[str, str] = {}  # process_lower -> emoji
+        self._activity_cache: Dict[str, Tuple[str, ...]] = {}  # process_lower -> activity list
+        self._process_name_cache: Dict[str, Tuple[str, str]] = {}  # process_name -> (clean_name, process_lower)
 
     def get_persona_for_window(self, hwnd: int, title: str, process_name: str) -> Tuple[str, str]:
         """Get or create a persona for a window.
@@ -185,33 +229,54 @@ class PersonificationManager:
         Returns:
             Tuple of (persona_name, activity_description)
         """
+        clean_name, process_lower = self._normalize_process_name(process_name)
+
         # Check if we already have a persona for this window
-        if hwnd in self._window_to_persona:
-            persona_info = self._window_to_persona[hwnd]
-            activity = self._generate_activity(title, process_name, persona_info)
-            return persona_info['name'], activity
+        persona = self._window_to_persona.get(hwnd)
+        if persona is None:
+            # Assign a new persona
+            persona = self._assign_persona(clean_name, process_lower, title)
+            self._window_to_persona[hwnd] = persona
+            if len(self._window_to_persona) > MAX_TRACKED_PERSONAS:
+                self._window_to_persona.popitem(last=False)
+        else:
+            self._window_to_persona.move_to_end(hwnd)
 
-        # Assign a new persona
-        persona = self._assign_persona(process_name, title)
-        self._window_to_persona[hwnd] = persona
-        activity = self._generate_activity(title, process_name, persona)
+        name, emoji = persona
+        activity = self._generate_activity(clean_name, process_lower, emoji)
 
-        return persona['name'], activity
+        return name, activity
 
-    def _assign_persona(self, process_name: str, window_title: str = "") -> Dict:
-        """Assign a persona to a new window based on process name.
+    def _normalize_process_name(self, process_name: str) -> Tuple[str, str]:
+        """Get the cleaned and lowercased forms of a process name.
 
         Args:
             process_name: Name of the process
-            window_title: Window title (used for ApplicationFrameHost)
 
         Returns:
-            Persona dictionary with name and emoji
+            Tuple of (clean_name, process_lower)
         """
-        # Clean up process name (remove .exe, etc.)
-        clean_name = process_name.replace('.exe', '').replace('.app', '')
-        clean_name = clean_name.strip().lower()
+        normalized = self._process_name_cache.get(process_name)
+        if normalized is None:
+            # Clean up process name (remove .exe, etc.)
+            clean_name = process_name.replace('.exe', '').replace('.app', '')
+            clean_name = clean_name.strip().lower()
+            normalized = (clean_name, process_name.lower())
+            self._process_name_cache[process_name] = normalized
+        return normalized
+
+    def _assign_persona(self, clean_name: str, process_lower: str,
+                        window_title: str = "") -> Tuple[str, str]:
+        """Assign a persona to a new window based on process name.
+
+        Args:
+            clean_name: Lowercase process name without extension
+            process_lower: Lowercase process name
+            window_title: Window title (used for ApplicationFrameHost)
 
+        Returns:
+            Tuple of (persona_name, emoji)
+        """
         # Special case: ApplicationFrameHost (Windows UWP) uses window title
         if 'applicationframehost' in clean_name and window_title:
             base_name = window_title.strip()
@@ -272,12 +337,9 @@ class PersonificationManager:
         persona_name = self._generate_unique_name(base_name, lookup_key)
 
         # Get appropriate emoji
-        emoji = self._get_emoji_for_app(process_name.lower())
+        emoji = self._get_emoji_for_app(process_lower, clean_name)
 
-        return {
-            'name': persona_name,
-            'emoji': emoji
-        }
+        return persona_name, emoji
 
     def _generate_unique_name(self, base_name: str, process_lower: str) -> str:
         """Generate a unique personified name.
@@ -292,64 +354,73 @@ class PersonificationManager:
         # Check if this base name already exists
         if base_name not in self._used_names:
             self._used_names[base_name] = 0
+            # Evicted names may be handed out again without a number
+            if len(self._used_names) > MAX_TRACKED_PERSONAS:
+                self._used_names.popitem(last=False)
             # First instance - just use the name
             return base_name
         else:
             # Multiple instances - add a number
             self._used_names[base_name] += 1
+            self._used_names.move_to_end(base_name)
             count = self._used_names[base_name]
             return f"{base_name} #{count + 1}"
 
-    def _get_emoji_for_app(self, process_lower: str) -> str:
+    def _get_emoji_for_app(self, process_lower: str, clean_lower: str = "") -> str:
         """Get an appropriate emoji for an app.
 
         Args:
             process_lower: Lowercase process name
+            clean_lower: Lowercase process name without extension
 
         Returns:
             Emoji string
         """
-        # Check for matches in emoji map
-        for key, emoji in EMOJI_MAP.items():
-            if key in process_lower:
-                return emoji
-
-        # For apps without specific emoji, use diverse person
-        # Get next person from pool (cycling through)
-        emoji = self._person_emoji_pool[self._person_emoji_index]
-        self._person_emoji_index = (self._person_emoji_index + 1) % len(self._person_emoji_pool)
-
+        # Repeat processes reuse the emoji picked the first time
+        cached = self._emoji_cache.get(process_lower)
+        if cached is not None:
+            return cached
+
+        # Check for matches in emoji map (exact key first, then substring)
+        emoji = _EMOJI_EXACT.get(clean_lower)
+        if emoji is None:
+            emoji = _find_first_match(_EMOJI_PATTERNS, process_lower)
+        if emoji is None:
+            # For apps without specific emoji, use diverse person
+            # Get next person from pool (cycling through)
+            emoji = next(self._person_emoji_iter)
+
+        self._emoji_cache[process_lower] = emoji
         return emoji
 
-    def _generate_activity(self, title: str, process_name: str, persona: Dict) -> str:
+    def _generate_activity(self, clean_name: str, process_lower: str, emoji: str) -> str:
         """Generate an activity description for a persona.
 
         Args:
-            title: Window title
-            process_name: Process name
-            persona: Persona dictionary
+            clean_name: Lowercase process name without extension
+            process_lower: Lowercase process name
+            emoji: Persona emoji
 
         Returns:
             Activity description
         """
-        process_lower = process_name.lower()
-
-        # Try to find matching activity mapping
-        activities = None
-        for app_key, app_activities in ACTIVITY_MAPPINGS.items():
-            if app_key in process_lower:
-                activities = app_activities
-                break
-
-        # Use default if no match
-        if not activities:
-            activities = ACTIVITY_MAPPINGS["default"]
+        activities = self._activity_cache.get(process_lower)
+        if activities is None:
+            # Try to find matching activity mapping (exact key first, then substring)
+            activities = _ACTIVITY_EXACT.get(clean_name)
+            if activities is None:
+                activities = _find_first_match(_ACTIVITY_PATTERNS, process_lower)
+
+            # Use default if no match
+            if not activities:
+                activities = ACTIVITY_MAPPINGS["default"]
+            self._activity_cache[process_lower] = activities
 
         # Pick a random activity
         activity = random.choice(activities)
 
         # Add emoji to make it more fun
-        return f"{persona['emoji']} {activity}"
+        return f"{emoji} {activity}"
 
     def remove_window(self, hwnd: int):
         """Remove a window's persona mapping.
@@ -388,9 +459,10 @@ class PersonificationManager:
         """
         persona_name, activity = self.get_persona_for_window(hwnd, title, process_name)
 
-        # Format the display
-        status_indicator = "🗣️ " if is_active else ""
-        display_title = f"{status_indicator}{persona_name} - {activity}"
-        display_process = f"in the house"
+        # Format the display (speaking indicator for the active window)
+        if is_active:
+            display_title = f"🗣️ {persona_name} - {activity}"
+        else:
+            display_title = f"{persona_name} - {activity}"
 
-        return display_title, display_process
+        return display_title, _IN_THE_HOUSE
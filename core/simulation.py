@@ -1,10 +1,12 @@
 """Simulation mode for testing - simulates people doing activities in a house."""
+import itertools
 import random
+import sys
 from datetime import datetime
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 # Family members and friends
-PEOPLE = [
+PEOPLE = (
     {"name": "Mom", "process": "parent.exe", "personality": "busy"},
     {"name": "Dad", "process": "parent.exe", "personality": "relaxed"},
     {"name": "Sarah", "process": "teenager.exe", "personality": "social"},
@@ -14,11 +16,11 @@ PEOPLE = [
     {"name": "Aunt Linda", "process": "visitor.exe", "personality": "helpful"},
     {"name": "Best Friend Alex", "process": "friend.exe", "personality": "fun"},
     {"name": "Neighbor Bob", "process": "neighbor.exe", "personality": "curious"},
-]
+)
 
 # Activities people can do in the house
 ACTIVITIES = {
-    "busy": [
+    "busy": (
         "Cooking dinner in the kitchen",
         "Doing laundry",
         "Cleaning the living room",
@@ -27,8 +29,8 @@ ACTIVITIES = {
         "Paying bills at desk",
         "Meal prepping",
         "Vacuuming upstairs",
-    ],
-    "relaxed": [
+    ),
+    "relaxed": (
         "Watching TV in living room",
         "Reading newspaper on couch",
         "Napping on recliner",
@@ -37,8 +39,8 @@ ACTIVITIES = {
         "Working on puzzle",
         "Browsing phone on patio",
         "Grilling in backyard",
-    ],
-    "social": [
+    ),
+    "social": (
         "Video chatting with friends",
         "Texting in bedroom",
         "Taking selfies",
@@ -47,8 +49,8 @@ ACTIVITIES = {
         "Listening to music and dancing",
         "Video calling boyfriend",
         "Shopping online",
-    ],
-    "energetic": [
+    ),
+    "energetic": (
         "Playing video games",
         "Running around backyard",
         "Playing with dog",
@@ -57,8 +59,8 @@ ACTIVITIES = {
         "Riding bike in driveway",
         "Playing basketball",
         "Making a mess in playroom",
-    ],
-    "calm": [
+    ),
+    "calm": (
         "Knitting on couch",
         "Watching cooking show",
         "Reading book in armchair",
@@ -67,8 +69,8 @@ ACTIVITIES = {
         "Watering plants",
         "Baking cookies",
         "Having tea in garden",
-    ],
-    "chatty": [
+    ),
+    "chatty": (
         "Telling stories in living room",
         "Making phone calls",
         "Chatting at kitchen table",
@@ -77,8 +79,8 @@ ACTIVITIES = {
         "Debating politics",
         "Laughing about old times",
         "Giving unsolicited advice",
-    ],
-    "helpful": [
+    ),
+    "helpful": (
         "Helping with dishes",
         "Teaching recipe to Mom",
         "Fixing things around house",
@@ -87,8 +89,8 @@ ACTIVITIES = {
         "Setting the table",
         "Giving parenting tips",
         "Organizing pantry",
-    ],
-    "fun": [
+    ),
+    "fun": (
         "Playing board games",
         "Telling jokes",
         "Playing cards",
@@ -97,8 +99,8 @@ ACTIVITIES = {
         "Playing music together",
         "Having pillow fight",
         "Making funny videos",
-    ],
-    "curious": [
+    ),
+    "curious": (
         "Peeking through window",
         "Asking about new car",
         "Checking out renovations",
@@ -107,44 +109,58 @@ ACTIVITIES = {
         "Asking to borrow tools",
         "Sharing HOA concerns",
         "Talking about weather",
-    ],
+    ),
 }
 
+# Intern the activity phrases (multi-word literals are not interned automatically)
+ACTIVITIES = {personality: tuple(map(sys.intern, activities)) for personality, activities in ACTIVITIES.items()}
+
 
 class SimulatedPerson:
     """Represents a simulated person in the house."""
 
-    def __init__(self, person_data: dict):
+    # Fake window handles, unique across all simulated people
+    _hwnd_counter = itertools.count(10000)
+
+    def __init__(self, person_data: dict, rng: Optional[random.Random] = None):
         """Initialize a simulated person.
 
         Args:
             person_data: Dictionary with name, process, personality
+            rng: Random generator to draw from (a private one if None)
         """
+        self._rng = rng if rng is not None else random.Random()
         self.name = person_data["name"]
         self.process_name = person_data["process"]
         self.personality = person_data["personality"]
-        self.hwnd = random.randint(10000, 99999)  # Fake window handle
+        self._cached_tuple: Optional[Tuple[int, str, str]] = None  # Last window info tuple
+        self.pool_slot: Optional[int] = None  # Index in the owning simulation's pool
+        self.reset()
+
+    def reset(self):
+        """Start a fresh visit: new window handle, activity and boredom."""
+        self.hwnd = next(SimulatedPerson._hwnd_counter)  # Fake window handle
         self.current_activity = self._get_random_activity()
         self.activity_start_time = datetime.now()
-        self.boredom_factor = random.uniform(0.3, 0.7)  # How quickly they change activities
+        self.boredom_factor = self._rng.uniform(0.3, 0.7)  # How quickly they change activities
+        self.change_chance = self.boredom_factor * 0.1  # 3-7% chance per update
+        self._dirty = True  # Rebuild cached tuple on next get_window_info()
 
     def _get_random_activity(self) -> str:
         """Get a random activity based on personality."""
         activities = ACTIVITIES.get(self.personality, ACTIVITIES["relaxed"])
-        return random.choice(activities)
+        # Activity lists have 8 entries, so the modulo index is unbiased
+        return activities[self._rng.getrandbits(8) % len(activities)]
 
-    def maybe_change_activity(self) -> bool:
-        """Randomly decide if person should change activity.
+    def change_activity(self, now: Optional[datetime] = None):
+        """Switch to a new random activity.
 
-        Returns:
-            True if activity changed, False otherwise
+        Args:
+            now: Current time (read from the clock if None)
         """
-        # Random chance based on boredom factor
-        if random.random() < self.boredom_factor * 0.1:  # 3-7% chance per update
-            self.current_activity = self._get_random_activity()
-            self.activity_start_time = datetime.now()
-            return True
-        return False
+        self.current_activity = self._get_random_activity()
+        self.activity_start_time = now if now is not None else datetime.now()
+        self._dirty = True
 
     def get_window_info(self) -> Tuple[int, str, str]:
         """Get window information tuple.
@@ -152,8 +168,11 @@ class SimulatedPerson:
         Returns:
             Tuple of (hwnd, title, process_name)
         """
-        title = f"{self.name} - {self.current_activity}"
-        return (self.hwnd, title, self.process_name)
+        if self._dirty:
+            title = f"{self.name} - {self.current_activity}"
+            self._cached_tuple = (self.hwnd, title, self.process_name)
+            self._dirty = False
+        return self._cached_tuple
 
 
 class HouseSimulation:
@@ -165,37 +184,58 @@ class HouseSimulation:
         Args:
             num_people: Number of people to simulate (None for random 4-9)
         """
+        self._rng = random.Random()  # Simulation-local generator shared with its people
+
         if num_people is None:
-            num_people = random.randint(4, 9)
+            num_people = self._rng.randint(4, 9)
+
+        # One pooled person per PEOPLE entry, reused as visitors come and go
+        self._person_pool = [SimulatedPerson(person, self._rng) for person in PEOPLE]
+        for slot, person in enumerate(self._person_pool):
+            person.pool_slot = slot
+        self._alive_mask = [False] * len(self._person_pool)
 
         # Randomly select people
-        selected_people = random.sample(PEOPLE, min(num_people, len(PEOPLE)))
-        self.people = [SimulatedPerson(person) for person in selected_people]
+        selected_slots = self._rng.sample(range(len(self._person_pool)), min(num_people, len(PEOPLE)))
+        for slot in selected_slots:
+            self._alive_mask[slot] = True
+        self.people = [self._person_pool[slot] for slot in selected_slots]
+
+        # Reused window info list (one slot per person, resized on add/remove)
+        self._windows_buffer: List[Tuple[int, str, str]] = [None] * len(self.people)
 
         # Track who is currently the "focus"
         self.current_focus_index = 0
-        self.focus_duration = random.uniform(5, 15)  # Seconds before focus changes
+        self.focus_duration = self._rng.uniform(5, 15)  # Seconds before focus changes
         self.last_focus_change = datetime.now()
 
     def update(self) -> Tuple[List[Tuple[int, str, str]], int]:
         """Update the simulation state.
 
         Returns:
-            Tuple of (list of window info tuples, active hwnd)
+            Tuple of (list of window info tuples, active hwnd).
+            The list is reused between calls; copy it to keep a snapshot.
         """
-        # Maybe change activities for some people
+        now = datetime.now()
+
+        # Maybe change activities for some people: each rolls against their
+        # boredom-based change_chance (inline, since most people don't change)
+        roll = self._rng.random
         for person in self.people:
-            person.maybe_change_activity()
+            if roll() < person.change_chance:
+                person.change_activity(now)
 
         # Maybe change focus
-        time_since_focus = (datetime.now() - self.last_focus_change).total_seconds()
+        time_since_focus = (now - self.last_focus_change).total_seconds()
         if time_since_focus > self.focus_duration:
-            self.current_focus_index = random.randint(0, len(self.people) - 1)
-            self.focus_duration = random.uniform(3, 20)  # Next focus duration
-            self.last_focus_change = datetime.now()
+            self.current_focus_index = self._rng.randrange(len(self.people))
+            self.focus_duration = self._rng.uniform(3, 20)  # Next focus duration
+            self.last_focus_change = now
 
-        # Get all window info
-        windows = [person.get_window_info() for person in self.people]
+        # Get all window info (overwrite buffer slots in place)
+        windows = self._windows_buffer
+        for i, person in enumerate(self.people):
+            windows[i] = person.get_window_info()
 
         # Get active window handle
         active_hwnd = self.people[self.current_focus_index].hwnd
@@ -208,24 +248,34 @@ class HouseSimulation:
 
     def add_visitor(self):
         """Add a random visitor to the house."""
-        # Find people not currently in the simulation
-        current_names = {person.name for person in self.people}
-        available = [p for p in PEOPLE if p["name"] not in current_names]
+        # Find pooled people not currently in the simulation
+        available = [slot for slot, alive in enumerate(self._alive_mask) if not alive]
 
         if available:
-            new_person_data = random.choice(available)
-            new_person = SimulatedPerson(new_person_data)
+            slot = self._rng.choice(available)
+            self._alive_mask[slot] = True
+            new_person = self._person_pool[slot]
+            new_person.reset()
             self.people.append(new_person)
+            self._windows_buffer.append(None)
             return new_person.name
         return None
 
     def remove_person(self):
         """Remove a random person from the house (they leave)."""
         if len(self.people) > 2:  # Keep at least 2 people
-            person = random.choice(self.people)
-            self.people.remove(person)
-            # Adjust focus index if needed
-            if self.current_focus_index >= len(self.people):
+            # Swap-remove: move the last person into the leaving person's slot
+            idx = self._rng.randrange(len(self.people))
+            last = len(self.people) - 1
+            person = self.people[idx]
+            self.people[idx] = self.people[last]
+            self.people.pop()
+            self._alive_mask[person.pool_slot] = False
+            self._windows_buffer.pop()
+            # Adjust focus index if needed (the focused last person moved to idx)
+            if self.current_focus_index == last and idx != last:
+                self.current_focus_index = idx
+            elif self.current_focus_index >= len(self.people):
                 self.current_focus_index = len(self.people) - 1
             return person.name
         return None
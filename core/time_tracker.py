@@ -2,8 +2,8 @@
 import logging
 import threading
 import time
-from datetime import datetime
-from typing import Dict, List, Optional
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Set, Tuple
 
 from config import WINDOW_ENUMERATION_INTERVAL, TRACKING_THREAD_NAME, DAEMON_THREAD
 from core.data_models import WindowInfo
@@ -22,8 +22,13 @@ class TimeTracker:
             simulation_mode: If True, use simulation instead of real window tracking
         """
         self._windows: Dict[int, WindowInfo] = {}
-        self._lock = threading.Lock()
+        self._lock = threading.Lock()  # Serializes writers (_update_windows, clear)
+        # Read-only snapshots republished after each write; readers take no lock
+        self._snapshot: Tuple[WindowInfo, ...] = ()
+        self._by_hwnd: Dict[int, WindowInfo] = {}
+        self._visible_hwnds: Set[int] = set()  # hwnds seen in the latest update
         self._running = False
+        self._stop_event = threading.Event()  # Wakes the tracking loop on stop()
         self._thread: Optional[threading.Thread] = None
         self._last_update_time = None
         self._simulation_mode = simulation_mode
@@ -49,7 +54,8 @@ class TimeTracker:
             return
 
         self._running = True
-        self._last_update_time = time.time()
+        self._stop_event.clear()
+        self._last_update_time = time.monotonic()
         self._thread = threading.Thread(
             target=self._tracking_loop,
             name=TRACKING_THREAD_NAME,
@@ -65,6 +71,7 @@ class TimeTracker:
             return
 
         self._running = False
+        self._stop_event.set()
         if self._thread:
             self._thread.join(timeout=2.0)
         logger.info("TimeTracker stopped")
@@ -73,16 +80,29 @@ class TimeTracker:
         """Clear all tracked window data."""
         with self._lock:
             self._windows.clear()
+            self._visible_hwnds = set()
+            self._publish_snapshot()
         logger.info("TimeTracker data cleared")
 
-    def get_all_windows(self) -> List[WindowInfo]:
-        """Get a copy of all tracked windows.
+    def _publish_snapshot(self):
+        """Publish the current windows for lock-free readers.
+
+        Must be called with self._lock held. Rebinding the attributes is
+        atomic, so readers always see a complete snapshot.
+        """
+        self._by_hwnd = dict(self._windows)
+        self._snapshot = tuple(self._by_hwnd.values())
+
+    def get_all_windows(self) -> Tuple[WindowInfo, ...]:
+        """Get all tracked windows.
+
+        The returned tuple is the shared snapshot published by the last
+        tick; callers must treat it as read-only.
 
         Returns:
-            List of WindowInfo objects
+            Tuple of WindowInfo objects
         """
-        with self._lock:
-            return list(self._windows.values())
+        return self._snapshot
 
     def get_window(self, hwnd: int) -> Optional[WindowInfo]:
         """Get information about a specific window.
@@ -93,11 +113,11 @@ class TimeTracker:
         Returns:
             WindowInfo object or None if not found
         """
-        with self._lock:
-            return self._windows.get(hwnd)
+        return self._by_hwnd.get(hwnd)
 
+    @property
     def is_running(self) -> bool:
-        """Check if the tracker is currently running.
+        """Whether the tracker is currently running.
 
         Returns:
             True if running, False otherwise
@@ -107,23 +127,29 @@ class TimeTracker:
     def _tracking_loop(self):
         """Main tracking loop running in background thread."""
         logger.info("Tracking loop started")
+        next_tick = time.monotonic()
 
         while self._running:
             try:
-                # Calculate time since last update
-                current_time = time.time()
+                # Calculate time since last update (monotonic: immune to clock jumps)
+                current_time = time.monotonic()
                 interval = current_time - self._last_update_time
                 self._last_update_time = current_time
 
                 # Update window tracking
                 self._update_windows(interval)
 
-                # Sleep until next cycle
-                time.sleep(WINDOW_ENUMERATION_INTERVAL)
-
             except Exception as e:
-                logger.error(f"Error in tracking loop: {e}", exc_info=True)
-                time.sleep(WINDOW_ENUMERATION_INTERVAL)
+                logger.error("Error in tracking loop: %s", e, exc_info=True)
+
+            # Sleep until next cycle on a fixed schedule; skip missed ticks
+            # rather than bursting to catch up after a slow update
+            next_tick += WINDOW_ENUMERATION_INTERVAL
+            now = time.monotonic()
+            if next_tick < now:
+                next_tick = now
+            if self._stop_event.wait(next_tick - now):
+                break
 
         logger.info("Tracking loop ended")
 
@@ -133,75 +159,99 @@ class TimeTracker:
         Args:
             interval: Time interval in seconds since last update
         """
+        # Shared by every window seen or updated this tick
+        now = datetime.now()
+        interval_td = timedelta(seconds=interval)
+
+        # Classify windows against the published snapshot outside the lock
+        # (only this thread adds windows, but clear() may still run before the
+        # lock is taken, so updates are re-checked under it)
+        known = self._by_hwnd
+        to_update = []  # (existing WindowInfo, hwnd, title, process_name, is_visible, is_active)
+        to_add: Dict[int, WindowInfo] = {}
+
         # Get current windows from platform-specific tracker or simulation
         if self._simulation_mode and self._simulation:
             current_windows, active_hwnd = self._simulation.update()
-            # Convert to list of tuples for backward compatibility
-            current_windows_list = [(hwnd, title, process) for hwnd, title, process in current_windows]
+            current_hwnds = set()
+
+            # Use the simulation's cached tuples directly; only windows not
+            # tracked yet need a WindowInfo
+            for hwnd, title, process_name in current_windows:
+                current_hwnds.add(hwnd)
+                is_active = hwnd == active_hwnd
+                existing = known.get(hwnd)
+                if existing is not None:
+                    to_update.append((existing, hwnd, title, process_name, True, is_active))
+                else:
+                    to_add[hwnd] = WindowInfo(
+                        hwnd=hwnd,
+                        title=title,
+                        process_name=process_name,
+                        first_seen=now,
+                        last_seen=now,
+                        is_active=is_active,
+                        is_visible=True
+                    )
         else:
             # Use platform-specific window tracker
-            windows = self._window_tracker.enumerate_windows()
-            current_windows_list = windows
-            active_hwnd = self._window_tracker.get_active_window_handle()
-
-        # Get set of current window handles
-        if self._simulation_mode:
-            current_hwnds = {hwnd for hwnd, _, _ in current_windows_list}
-        else:
+            current_windows_list = self._window_tracker.enumerate_windows()
             current_hwnds = {w.hwnd for w in current_windows_list}
 
+            for window_info in current_windows_list:
+                existing = known.get(window_info.hwnd)
+                if existing is not None:
+                    to_update.append((existing, window_info.hwnd, window_info.title,
+                                      window_info.process_name, window_info.is_visible,
+                                      window_info.is_active))
+                else:
+                    window_info.first_seen = now
+                    window_info.last_seen = now
+                    to_add[window_info.hwnd] = window_info
+
         with self._lock:
+            # Windows that disappeared since the last update; computed under
+            # the lock so it can't race with clear()
+            to_mark_invisible = self._visible_hwnds - current_hwnds
+
             # Update existing windows and add new ones
-            if self._simulation_mode:
-                # Simulation mode: old tuple format
-                for hwnd, title, process_name in current_windows_list:
-                    is_currently_active = (hwnd == active_hwnd)
-
-                    if hwnd in self._windows:
-                        # Update existing window
-                        window_info = self._windows[hwnd]
-                        window_info.update_times(interval, is_currently_active)
-                        window_info.title = title
-                        window_info.is_visible = True
-                    else:
-                        # Add new window
-                        window_info = WindowInfo(
-                            hwnd=hwnd,
-                            title=title,
-                            process_name=process_name,
-                            first_seen=datetime.now(),
-                            last_seen=datetime.now(),
-                            is_active=is_currently_active,
-                            is_visible=True
-                        )
-                        self._windows[hwnd] = window_info
-                        logger.info(f"New window tracked: {title} ({process_name})")
-            else:
-                # Platform-specific tracker: WindowInfo objects
-                for window_info in current_windows_list:
-                    hwnd = window_info.hwnd
-                    is_currently_active = window_info.is_active
-
-                    if hwnd in self._windows:
-                        # Update existing window
-                        existing = self._windows[hwnd]
-                        existing.update_times(interval, is_currently_active)
-                        existing.title = window_info.title
-                        existing.is_visible = window_info.is_visible
-                        existing.is_active = is_currently_active
-                    else:
-                        # Add new window
-                        window_info.first_seen = datetime.now()
-                        window_info.last_seen = datetime.now()
-                        self._windows[hwnd] = window_info
-                        logger.info(f"New window tracked: {window_info.title} ({window_info.process_name})")
-
-            # Mark windows that are no longer visible
-            for hwnd in list(self._windows.keys()):
-                if hwnd not in current_hwnds:
-                    if hwnd in self._windows:
-                        self._windows[hwnd].is_visible = False
-                        logger.debug(f"Window no longer visible: {hwnd}")
+            windows = self._windows
+            for existing, hwnd, title, process_name, is_visible, is_currently_active in to_update:
+                if windows.get(hwnd) is not existing:
+                    # Dropped by a concurrent clear(); track it afresh
+                    to_add[hwnd] = WindowInfo(
+                        hwnd=hwnd,
+                        title=title,
+                        process_name=process_name,
+                        first_seen=now,
+                        last_seen=now,
+                        is_active=is_currently_active,
+                        is_visible=is_visible
+                    )
+                    continue
+                existing.update_times(interval_td, now, is_currently_active)
+                existing.title = title
+                existing.is_visible = is_visible
+
+            # Republish only when the set of windows changed; in the steady
+            # state existing entries were updated in place and the snapshot
+            # readers hold is still current
+            if current_hwnds != self._visible_hwnds:
+                self._windows.update(to_add)
+
+                for hwnd in to_mark_invisible:
+                    window_info = windows.get(hwnd)
+                    if window_info is not None:
+                        window_info.is_visible = False
+
+                self._visible_hwnds = current_hwnds
+                self._publish_snapshot()
+
+        for window_info in to_add.values():
+            logger.info("New window tracked: %s (%s)", window_info.title, window_info.process_name)
+        if to_mark_invisible and logger.isEnabledFor(logging.DEBUG):
+            for hwnd in to_mark_invisible:
+                logger.debug("Window no longer visible: %s", hwnd)
 
     def get_stats(self) -> Dict[str, any]:
         """Get tracking statistics.
@@ -209,18 +259,18 @@ class TimeTracker:
         Returns:
             Dictionary with tracking stats
         """
-        with self._lock:
-            total_windows = len(self._windows)
-            visible_windows = sum(1 for w in self._windows.values() if w.is_visible)
-            active_window = next((w for w in self._windows.values() if w.is_active), None)
-
-            return {
-                'total_windows': total_windows,
-                'visible_windows': visible_windows,
-                'active_window': active_window.title if active_window else None,
-                'is_running': self._running,
-                'simulation_mode': self._simulation_mode
-            }
+        windows = self._snapshot
+        total_windows = len(windows)
+        visible_windows = sum(1 for w in windows if w.is_visible)
+        active_window = next((w for w in windows if w.is_active), None)
+
+        return {
+            'total_windows': total_windows,
+            'visible_windows': visible_windows,
+            'active_window': active_window.title if active_window else None,
+            'is_running': self._running,
+            'simulation_mode': self._simulation_mode
+        }
 
     def add_simulation_visitor(self) -> Optional[str]:
         """Add a visitor to the simulation (simulation mode only).
@@ -3,12 +3,28 @@ import sys
 import logging
 
 from core.window_tracker_base import WindowTrackerBase
-from core.window_tracker_windows import WindowsWindowTracker
-from core.window_tracker_macos import MacOSWindowTracker
 
 logger = logging.getLogger(__name__)
 
 
+def _load_platform_tracker():
+    """Import and instantiate the tracker matching sys.platform.
+
+    Only the module for the running platform is imported, so the other
+    platform's SDK bindings are never loaded.
+
+    Returns:
+        Platform-specific WindowTracker instance, or None on an unknown platform
+    """
+    if sys.platform == 'win32':
+        from core.window_tracker_windows import WindowsWindowTracker
+        return WindowsWindowTracker()
+    if sys.platform == 'darwin':
+        from core.window_tracker_macos import MacOSWindowTracker
+        return MacOSWindowTracker()
+    return None
+
+
 def create_window_tracker() -> WindowTrackerBase:
     """Create a window tracker for the current platform.
 
@@ -18,17 +34,10 @@ def create_window_tracker() -> WindowTrackerBase:
     Raises:
         RuntimeError: If no supported platform is detected
     """
-    # Try Windows first
-    windows_tracker = WindowsWindowTracker()
-    if windows_tracker.is_supported():
-        logger.info("Using Windows window tracker")
-        return windows_tracker
-
-    # Try macOS
-    macos_tracker = MacOSWindowTracker()
-    if macos_tracker.is_supported():
-        logger.info("Using macOS window tracker")
-        return macos_tracker
+    tracker = _load_platform_tracker()
+    if tracker is not None and tracker.is_supported():
+        logger.info("Using %s window tracker", 'Windows' if sys.platform == 'win32' else 'macOS')
+        return tracker
 
     # No supported platform found
     platform = sys.platform
@@ -49,14 +58,7 @@ def get_supported_platforms() -> list:
     Returns:
         List of platform names that are supported
     """
-    supported = []
-
-    windows_tracker = WindowsWindowTracker()
-    if windows_tracker.is_supported():
-        supported.append("Windows")
-
-    macos_tracker = MacOSWindowTracker()
-    if macos_tracker.is_supported():
-        supported.append("macOS")
-
-    return supported
+    tracker = _load_platform_tracker()
+    if tracker is None or not tracker.is_supported():
+        return []
+    return ["Windows" if sys.platform == 'win32' else "macOS"]
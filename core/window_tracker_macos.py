@@ -1,6 +1,7 @@
 """macOS-specific window tracking implementation."""
 import sys
 import logging
+from datetime import datetime
 from typing import List, Optional
 
 from core.window_tracker_base import WindowTrackerBase
@@ -22,6 +23,18 @@ from config import MIN_TITLE_LENGTH
 
 logger = logging.getLogger(__name__)
 
+# System applications excluded from tracking
+_EXCLUDED_APPS = frozenset({
+    'Dock',
+    'Spotlight',
+    'SystemUIServer',
+    'ControlCenter',
+    'NotificationCenter',
+    'WindowServer',
+    'loginwindow',
+    'Finder',  # Optional - you may want to track Finder windows
+})
+
 
 class MacOSWindowTracker(WindowTrackerBase):
     """macOS-specific window tracking using Quartz and AppKit."""
@@ -31,6 +44,9 @@ class MacOSWindowTracker(WindowTrackerBase):
         self._workspace = None
         if MACOS_AVAILABLE:
             self._workspace = NSWorkspace.sharedWorkspace()
+        # Active application name from the latest enumeration, shared with
+        # get_active_window_handle so each tick crosses the bridge once
+        self._active_app_name: Optional[str] = None
 
     def is_supported(self) -> bool:
         """Check if macOS platform is available."""
@@ -48,6 +64,8 @@ class MacOSWindowTracker(WindowTrackerBase):
 
         windows = []
         active_app_name = self._get_active_app_name()
+        now = datetime.now()  # Shared first/last seen time for this enumeration
+        self._active_app_name = active_app_name
 
         try:
             # Get all on-screen windows
@@ -56,39 +74,43 @@ class MacOSWindowTracker(WindowTrackerBase):
                 kCGNullWindowID
             )
 
-            for window in window_list:
-                # Filter system windows (only show layer 0 = normal windows)
-                layer = window.get('kCGWindowLayer', 0)
-                if layer != 0:
-                    continue
+            # Local bindings for the per-window loop
+            excluded_apps = _EXCLUDED_APPS
+            min_title_length = MIN_TITLE_LENGTH
+            make_window_info = WindowInfo
+            append = windows.append
 
-                # Get window info
-                title = window.get('kCGWindowName', '')
-                owner = window.get('kCGWindowOwnerName', '')
-                window_id = window.get('kCGWindowNumber', 0)
+            # Checks run cheapest-first so rejected windows cost as little as possible
+            for window in window_list:
+                get = window.get
 
-                # Skip windows without titles or from system processes
-                if not title or len(title) < MIN_TITLE_LENGTH:
+                # Filter system windows (only show layer 0 = normal windows)
+                if get('kCGWindowLayer', 0) != 0:
                     continue
 
                 # Skip certain system applications
-                if self._should_exclude_app(owner):
+                owner = get('kCGWindowOwnerName', '')
+                if owner in excluded_apps:
                     continue
 
-                # Check if this window belongs to the active application
-                is_active = (owner == active_app_name)
+                # Skip windows without titles
+                title = get('kCGWindowName', '')
+                if not title or len(title) < min_title_length:
+                    continue
 
-                window_info = WindowInfo(
-                    hwnd=window_id,
+                append(make_window_info(
+                    hwnd=get('kCGWindowNumber', 0),
                     title=title,
                     process_name=owner,
-                    is_active=is_active,
+                    first_seen=now,
+                    last_seen=now,
+                    # Check if this window belongs to the active application
+                    is_active=(owner == active_app_name),
                     is_visible=True
-                )
-                windows.append(window_info)
+                ))
 
         except Exception as e:
-            logger.error(f"Error enumerating windows on macOS: {e}")
+            logger.error("Error enumerating windows on macOS: %s", e)
 
         return windows
 
@@ -97,6 +119,8 @@ class MacOSWindowTracker(WindowTrackerBase):
 
         Note: On macOS, we can only reliably get the active application,
         not the specific window. Returns a synthetic ID based on app name.
+        Reuses the application captured by the latest enumerate_windows call
+        and only queries NSWorkspace if no enumeration has run yet.
 
         Returns:
             Synthetic window ID or None
@@ -104,14 +128,11 @@ class MacOSWindowTracker(WindowTrackerBase):
         if not MACOS_AVAILABLE:
             return None
 
-        try:
-            active_app = self._workspace.activeApplication()
-            app_name = active_app.get('NSApplicationName', '')
-            # Return hash of app name as synthetic window ID
-            return hash(app_name) if app_name else None
-        except Exception as e:
-            logger.debug(f"Error getting active window: {e}")
-            return None
+        app_name = self._active_app_name
+        if app_name is None:
+            app_name = self._get_active_app_name()
+        # Return hash of app name as synthetic window ID
+        return hash(app_name) if app_name else None
 
     def _get_active_app_name(self) -> str:
         """Get the name of the currently active application.
@@ -123,28 +144,5 @@ class MacOSWindowTracker(WindowTrackerBase):
             active_app = self._workspace.activeApplication()
             return active_app.get('NSApplicationName', '')
         except Exception as e:
-            logger.debug(f"Error getting active app: {e}")
+            logger.debug("Error getting active app: %s", e)
             return ""
-
-    def _should_exclude_app(self, app_name: str) -> bool:
-        """Check if an application should be excluded from tracking.
-
-        Args:
-            app_name: Application name
-
-        Returns:
-            True if app should be excluded
-        """
-        # Exclude common system applications
-        excluded_apps = {
-            'Dock',
-            'Spotlight',
-            'SystemUIServer',
-            'ControlCenter',
-            'NotificationCenter',
-            'WindowServer',
-            'loginwindow',
-            'Finder',  # Optional - you may want to track Finder windows
-        }
-
-        return app_name in excluded_apps
@@ -1,16 +1,30 @@
 """Windows-specific window tracking implementation."""
 import sys
 import logging
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional
 
 from core.window_tracker_base import WindowTrackerBase
 from core.data_models import WindowInfo
 
 try:
+    import ctypes
+    from ctypes import wintypes
     import win32gui
     import win32process
     import win32con
     import psutil
+
+    # Private kernel32 handle so these prototypes don't leak into ctypes.windll
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    _kernel32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    _kernel32.OpenProcess.restype = wintypes.HANDLE
+    _kernel32.QueryFullProcessImageNameW.argtypes = (
+        wintypes.HANDLE, wintypes.DWORD, wintypes.LPWSTR, ctypes.POINTER(wintypes.DWORD)
+    )
+    _kernel32.QueryFullProcessImageNameW.restype = wintypes.BOOL
+    _kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+    _kernel32.CloseHandle.restype = wintypes.BOOL
     WINDOWS_AVAILABLE = True
 except ImportError:
     WINDOWS_AVAILABLE = False
@@ -19,10 +33,45 @@ from config import EXCLUDED_WINDOW_CLASSES, EXCLUDED_WINDOW_TITLES, MIN_TITLE_LE
 
 logger = logging.getLogger(__name__)
 
+_PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+_IMAGE_PATH_BUFFER_LENGTH = 520
+
+
+def _query_image_name(pid: int) -> Optional[str]:
+    """Get a process's executable name straight from kernel32.
+
+    Args:
+        pid: Process ID
+
+    Returns:
+        Executable file name (e.g. "chrome.exe"), or None if the process
+        could not be queried
+    """
+    handle = _kernel32.OpenProcess(_PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return None
+
+    try:
+        buffer = ctypes.create_unicode_buffer(_IMAGE_PATH_BUFFER_LENGTH)
+        size = wintypes.DWORD(_IMAGE_PATH_BUFFER_LENGTH)
+        if not _kernel32.QueryFullProcessImageNameW(handle, 0, buffer, ctypes.byref(size)):
+            return None
+    finally:
+        _kernel32.CloseHandle(handle)
+
+    return buffer.value.rsplit('\\', 1)[-1]
+
 
 class WindowsWindowTracker(WindowTrackerBase):
     """Windows-specific window tracking using win32 API."""
 
+    def __init__(self):
+        """Initialize Windows window tracker."""
+        # Per-hwnd caches for attributes fixed for a window's lifetime,
+        # pruned to the hwnds seen in the latest enumeration
+        self._process_names: Dict[int, str] = {}
+        self._class_names: Dict[int, str] = {}
+
     def is_supported(self) -> bool:
         """Check if Windows platform is available."""
         return sys.platform == 'win32' and WINDOWS_AVAILABLE
@@ -39,28 +88,43 @@ class WindowsWindowTracker(WindowTrackerBase):
 
         windows = []
         active_hwnd = self.get_active_window_handle()
+        now = datetime.now()  # Shared first/last seen time for this enumeration
 
-        def callback(hwnd, _):
-            """Callback for EnumWindows."""
-            if self._is_valid_window(hwnd):
-                title = self._get_window_title(hwnd)
-                process_name = self._get_process_name(hwnd)
-                is_active = (hwnd == active_hwnd)
-
-                window_info = WindowInfo(
-                    hwnd=hwnd,
-                    title=title,
-                    process_name=process_name,
-                    is_active=is_active,
-                    is_visible=True
-                )
-                windows.append(window_info)
+        def callback(hwnd, hwnds):
+            """Callback for EnumWindows (only collects the raw handles)."""
+            hwnds.append(hwnd)
             return True
 
+        hwnds = []
         try:
-            win32gui.EnumWindows(callback, None)
+            win32gui.EnumWindows(callback, hwnds)
         except Exception as e:
-            logger.error(f"Error enumerating windows: {e}")
+            logger.error("Error enumerating windows: %s", e)
+
+        # Process the collected handles in one loop
+        get_trackable_title = self._get_trackable_title
+        get_process_name = self._get_process_name
+        for hwnd in hwnds:
+            # Validation and title lookup share one pass of win32 calls
+            title = get_trackable_title(hwnd)
+            if title is None:
+                continue
+
+            window_info = WindowInfo(
+                hwnd=hwnd,
+                title=title,
+                process_name=get_process_name(hwnd),
+                first_seen=now,
+                last_seen=now,
+                is_active=(hwnd == active_hwnd),
+                is_visible=True
+            )
+            windows.append(window_info)
+
+        # Forget closed windows so a reused hwnd is looked up again
+        seen_hwnds = set(hwnds)
+        self._process_names = {h: n for h, n in self._process_names.items() if h in seen_hwnds}
+        self._class_names = {h: n for h, n in self._class_names.items() if h in seen_hwnds}
 
         return windows
 
@@ -77,82 +141,86 @@ class WindowsWindowTracker(WindowTrackerBase):
             hwnd = win32gui.GetForegroundWindow()
             return hwnd if hwnd != 0 else None
         except Exception as e:
-            logger.debug(f"Error getting active window: {e}")
+            logger.debug("Error getting active window: %s", e)
             return None
 
-    def _is_valid_window(self, hwnd: int) -> bool:
-        """Check if a window is valid for tracking.
+    def _get_trackable_title(self, hwnd: int) -> Optional[str]:
+        """Check if a window is valid for tracking and get its title.
+
+        Each win32 call is made at most once per window.
 
         Args:
             hwnd: Window handle
 
         Returns:
-            True if window should be tracked
+            Window title if the window should be tracked, otherwise None
         """
+        # Any of these calls can raise if the window closes mid-enumeration,
+        # which is an expected race rather than an error worth logging; skip
+        # just this window
         try:
-            # Window must be visible
-            if not win32gui.IsWindowVisible(hwnd):
-                return False
+            # Cheap gates first
+            if not win32gui.IsWindow(hwnd) or not win32gui.IsWindowVisible(hwnd):
+                return None
 
             # Get window title
             title = win32gui.GetWindowText(hwnd)
             if len(title) < MIN_TITLE_LENGTH:
-                return False
+                return None
 
             # Exclude specific titles
             if title in EXCLUDED_WINDOW_TITLES:
-                return False
+                return None
 
-            # Get window class name
-            class_name = win32gui.GetClassName(hwnd)
+            # Get window class name (fixed for the window's lifetime)
+            class_name = self._class_names.get(hwnd)
+            if class_name is None:
+                class_name = win32gui.GetClassName(hwnd)
+                self._class_names[hwnd] = class_name
             if class_name in EXCLUDED_WINDOW_CLASSES:
-                return False
+                return None
 
             # Exclude tool windows (extended style check)
             ex_style = win32gui.GetWindowLong(hwnd, win32con.GWL_EXSTYLE)
             if ex_style & win32con.WS_EX_TOOLWINDOW:
-                return False
+                return None
 
             # Include only windows with WS_EX_APPWINDOW or no owner
             if not (ex_style & win32con.WS_EX_APPWINDOW):
                 # Check if window has an owner (child windows)
                 if win32gui.GetWindow(hwnd, win32con.GW_OWNER) != 0:
-                    return False
-
-            return True
-
-        except Exception as e:
-            logger.debug(f"Error validating window {hwnd}: {e}")
-            return False
+                    return None
+        except Exception:
+            return None
 
-    def _get_window_title(self, hwnd: int) -> str:
-        """Get window title.
-
-        Args:
-            hwnd: Window handle
-
-        Returns:
-            Window title
-        """
-        try:
-            return win32gui.GetWindowText(hwnd)
-        except Exception as e:
-            logger.debug(f"Error getting title for window {hwnd}: {e}")
-            return ""
+        return title
 
     def _get_process_name(self, hwnd: int) -> str:
         """Get process name for a window.
 
+        The owning process never changes for a window, so names are
+        resolved once per hwnd and then served from the cache.
+
         Args:
             hwnd: Window handle
 
         Returns:
             Process name
         """
+        name = self._process_names.get(hwnd)
+        if name is not None:
+            return name
+
         try:
             _, pid = win32process.GetWindowThreadProcessId(hwnd)
-            process = psutil.Process(pid)
-            return process.name()
+            # Only the image name is needed, so skip building a psutil.Process
+            # unless the direct query is refused
+            name = _query_image_name(pid)
+            if name is None:
+                name = psutil.Process(pid).name()
         except Exception as e:
-            logger.debug(f"Error getting process name for window {hwnd}: {e}")
+            logger.debug("Error getting process name for window %s: %s", hwnd, e)
             return "Unknown"
+
+        self._process_names[hwnd] = name
+        return name
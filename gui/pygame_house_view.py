@@ -1,9 +1,14 @@
 """Pygame-based house view for window tracking."""
 import pygame
+import math
 import random
 import sys
 import time
-from typing import Dict, List, Optional
+import heapq
+import itertools
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Optional, Sequence, Tuple
 import logging
 
 from core.data_models import WindowInfo
@@ -12,14 +17,52 @@ from gui.pygame_sprites import Persona, Door, SpeechBubble
 from gui.pygame_particles import ParticleSystem
 from gui.pygame_sounds import SoundManager
 from config import ALWAYS_ON_TOP
-from utils.formatters import format_timedelta
+from utils.formatters import format_seconds
 from datetime import timedelta
 import platform
 
 
+@lru_cache(maxsize=64)
+def _render_label(text, color):
+    """Render a button label, memoized by text and color.
+
+    Args:
+        text: Label text
+        color: Text color as an RGB tuple
+
+    Returns:
+        Rendered label surface (shared; do not draw onto it)
+    """
+    if Button._label_font is None:
+        Button._label_font = pygame.font.Font(None, 18)
+    return Button._label_font.render(text, True, color)
+
+
+@lru_cache(maxsize=256)
+def _render_text(font, text, color):
+    """Render antialiased text, memoized by font, text and color.
+
+    Args:
+        font: Font to render with
+        text: Text to render
+        color: Text color as an RGB tuple
+
+    Returns:
+        Rendered text surface (shared; do not draw onto it)
+    """
+    return font.render(text, True, color)
+
+
 class Button:
     """Base button class for UI elements."""
 
+    # Label font, created on first use (pygame.font must be initialized)
+    _label_font: Optional[pygame.font.Font] = None
+
+    # Pre-rendered faces (background, icon and label) keyed by button class,
+    # size and visual state, shared by all instances
+    _face_cache: Dict[tuple, Tuple[pygame.Surface, Tuple[int, int]]] = {}
+
     def __init__(self, pos, size=40):
         """Initialize button.
 
@@ -51,36 +94,86 @@ class Button:
         """
         return self.rect.collidepoint(mouse_pos)
 
-    def _draw_background(self, screen):
+    def _draw_background(self, surface, rect):
         """Draw button background.
 
         Args:
-            screen: Pygame surface to draw on
+            surface: Pygame surface to draw on
+            rect: Button rect on that surface
         """
         bg_color = (80, 80, 80) if self.hover else (100, 100, 100)
-        pygame.draw.rect(screen, bg_color, self.rect, border_radius=8)
-        pygame.draw.rect(screen, (60, 60, 60), self.rect, 2, border_radius=8)
+        pygame.draw.rect(surface, bg_color, rect, border_radius=8)
+        pygame.draw.rect(surface, (60, 60, 60), rect, 2, border_radius=8)
+
+    def _state_key(self) -> tuple:
+        """Get the visual state that selects a cached face.
+
+        Returns:
+            Tuple of every attribute the face depends on
+        """
+        return (self.hover,)
+
+    def _get_label(self):
+        """Get the label drawn below the button. Override in subclasses.
+
+        Returns:
+            (text, color) tuple
+        """
+        raise NotImplementedError("Subclasses must implement _get_label()")
 
-    def _draw_label(self, screen, text, color=(120, 120, 120)):
-        """Draw label below button.
+    def _draw_icon(self, surface, rect):
+        """Draw the button icon. Override in subclasses.
 
         Args:
-            screen: Pygame surface to draw on
-            text: Label text
-            color: Text color
+            surface: Pygame surface to draw on
+            rect: Button rect on that surface
+        """
+        raise NotImplementedError("Subclasses must implement _draw_icon()")
+
+    def _render_face(self):
+        """Render background, icon and label onto one transparent surface.
+
+        Returns:
+            (surface, offset) where offset is the surface's top-left relative
+            to the button rect's top-left
         """
-        label_font = pygame.font.Font(None, 18)
-        label_surf = label_font.render(text, True, color)
-        label_rect = label_surf.get_rect(center=(self.rect.centerx, self.rect.bottom + 12))
-        screen.blit(label_surf, label_rect)
+        label_surf = _render_label(*self._get_label())
+
+        # The label hangs below the button and may be wider than it
+        button_rect = pygame.Rect(0, 0, self.size, self.size)
+        label_rect = label_surf.get_rect(center=(button_rect.centerx, button_rect.bottom + 12))
+        bounds = button_rect.union(label_rect)
+        button_rect.move_ip(-bounds.x, -bounds.y)
+        label_rect.move_ip(-bounds.x, -bounds.y)
+
+        surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        self._draw_background(surface, button_rect)
+        surface.blit(label_surf, label_rect)
+        self._draw_icon(surface, button_rect)
+        return surface.convert_alpha(), bounds.topleft
+
+    def get_blit(self):
+        """Get the cached face and where to blit it this frame.
+
+        Returns:
+            (surface, position) pair suitable for Surface.blits()
+        """
+        key = (type(self), self.size) + self._state_key()
+        face = Button._face_cache.get(key)
+        if face is None:
+            face = self._render_face()
+            Button._face_cache[key] = face
+
+        surface, (offset_x, offset_y) = face
+        return surface, (self.rect.x + offset_x, self.rect.y + offset_y)
 
     def draw(self, screen):
-        """Draw the button. Override in subclasses.
+        """Draw the button.
 
         Args:
             screen: Pygame surface to draw on
         """
-        raise NotImplementedError("Subclasses must implement draw()")
+        screen.blit(*self.get_blit())
 
 
 class MuteButton(Button):
@@ -95,64 +188,65 @@ class MuteButton(Button):
         """Toggle mute state."""
         self.is_muted = not self.is_muted
 
-    def draw(self, screen):
-        """Draw the mute button."""
-        self._draw_background(screen)
+    def _state_key(self) -> tuple:
+        """Get the visual state that selects a cached face."""
+        return (self.hover, self.is_muted)
 
-        # Label
-        label_text = "Mute" if not self.is_muted else "Unmute"
-        self._draw_label(screen, label_text)
+    def _get_label(self):
+        """Get the mute button label."""
+        return ("Mute" if not self.is_muted else "Unmute"), (120, 120, 120)
 
-        # Draw speaker icon
-        center_x, center_y = self.rect.center
+    def _draw_icon(self, surface, rect):
+        """Draw the speaker icon."""
+        center_x, center_y = rect.center
         icon_color = (240, 240, 240)
 
         if self.is_muted:
             # Speaker with X
             # Speaker cone
-            pygame.draw.polygon(screen, icon_color, [
+            pygame.draw.polygon(surface, icon_color, [
                 (center_x - 8, center_y - 4),
                 (center_x - 8, center_y + 4),
                 (center_x - 14, center_y + 8),
                 (center_x - 14, center_y - 8)
             ])
             # Speaker body
-            pygame.draw.rect(screen, icon_color, (center_x - 14, center_y - 3, 4, 6))
+            pygame.draw.rect(surface, icon_color, (center_x - 14, center_y - 3, 4, 6))
 
             # X symbol
-            pygame.draw.line(screen, (255, 60, 60), (center_x - 2, center_y - 6), (center_x + 6, center_y + 2), 3)
-            pygame.draw.line(screen, (255, 60, 60), (center_x + 6, center_y - 6), (center_x - 2, center_y + 2), 3)
+            pygame.draw.line(surface, (255, 60, 60), (center_x - 2, center_y - 6), (center_x + 6, center_y + 2), 3)
+            pygame.draw.line(surface, (255, 60, 60), (center_x + 6, center_y - 6), (center_x - 2, center_y + 2), 3)
         else:
             # Speaker with sound waves
             # Speaker cone
-            pygame.draw.polygon(screen, icon_color, [
+            pygame.draw.polygon(surface, icon_color, [
                 (center_x - 8, center_y - 4),
                 (center_x - 8, center_y + 4),
                 (center_x - 14, center_y + 8),
                 (center_x - 14, center_y - 8)
             ])
             # Speaker body
-            pygame.draw.rect(screen, icon_color, (center_x - 14, center_y - 3, 4, 6))
+            pygame.draw.rect(surface, icon_color, (center_x - 14, center_y - 3, 4, 6))
 
             # Sound waves as curved brackets - using arcs positioned to look like )
             # Small wave
-            pygame.draw.arc(screen, icon_color, (center_x - 4, center_y - 5, 10, 10), -1.57, 1.57, 2)
+            pygame.draw.arc(surface, icon_color, (center_x - 4, center_y - 5, 10, 10), -1.57, 1.57, 2)
             # Medium wave
-            pygame.draw.arc(screen, icon_color, (center_x - 2, center_y - 8, 14, 16), -1.57, 1.57, 2)
+            pygame.draw.arc(surface, icon_color, (center_x - 2, center_y - 8, 14, 16), -1.57, 1.57, 2)
             # Large wave
-            pygame.draw.arc(screen, icon_color, (center_x, center_y - 11, 18, 22), -1.57, 1.57, 2)
+            pygame.draw.arc(surface, icon_color, (center_x, center_y - 11, 18, 22), -1.57, 1.57, 2)
 
 
 class StatsButton(Button):
     """Stats button UI element."""
 
-    def draw(self, screen):
-        """Draw the stats button."""
-        self._draw_background(screen)
-        self._draw_label(screen, "Stats")
+    def _get_label(self):
+        """Get the stats button label."""
+        return "Stats", (120, 120, 120)
 
-        # Draw bar chart icon
-        center_x, center_y = self.rect.center
+    def _draw_icon(self, surface, rect):
+        """Draw the bar chart icon."""
+        center_x, center_y = rect.center
         icon_color = (240, 240, 240)
 
         # Three bars of different heights
@@ -163,7 +257,7 @@ class StatsButton(Button):
         for i, height in enumerate(bar_heights):
             x = center_x - (len(bar_heights) * (bar_width + bar_spacing)) // 2 + i * (bar_width + bar_spacing)
             y = center_y + 10 - height
-            pygame.draw.rect(screen, icon_color, (x, y, bar_width, height))
+            pygame.draw.rect(surface, icon_color, (x, y, bar_width, height))
 
 
 class AlwaysOnTopButton(Button):
@@ -178,27 +272,29 @@ class AlwaysOnTopButton(Button):
         """Toggle pinned state."""
         self.is_pinned = not self.is_pinned
 
-    def draw(self, screen):
-        """Draw the always-on-top button."""
-        self._draw_background(screen)
+    def _state_key(self) -> tuple:
+        """Get the visual state that selects a cached face."""
+        return (self.hover, self.is_pinned)
 
-        # Label (golden when pinned)
+    def _get_label(self):
+        """Get the always-on-top label (golden when pinned)."""
         label_color = (255, 215, 0) if self.is_pinned else (120, 120, 120)
-        self._draw_label(screen, "Always On Top", label_color)
+        return "Always On Top", label_color
 
-        # Draw pin icon
-        center_x, center_y = self.rect.center
+    def _draw_icon(self, surface, rect):
+        """Draw the pin icon."""
+        center_x, center_y = rect.center
         icon_color = (255, 215, 0) if self.is_pinned else (240, 240, 240)
 
         if self.is_pinned:
             # Pinned icon (pushpin pushed in)
             # Pin head (circle)
-            pygame.draw.circle(screen, icon_color, (center_x, center_y - 6), 5)
-            pygame.draw.circle(screen, (200, 180, 0), (center_x, center_y - 6), 5, 2)
+            pygame.draw.circle(surface, icon_color, (center_x, center_y - 6), 5)
+            pygame.draw.circle(surface, (200, 180, 0), (center_x, center_y - 6), 5, 2)
             # Pin body (rectangle)
-            pygame.draw.rect(screen, icon_color, (center_x - 2, center_y - 1, 4, 10))
+            pygame.draw.rect(surface, icon_color, (center_x - 2, center_y - 1, 4, 10))
             # Pin point
-            pygame.draw.polygon(screen, icon_color, [
+            pygame.draw.polygon(surface, icon_color, [
                 (center_x - 2, center_y + 9),
                 (center_x + 2, center_y + 9),
                 (center_x, center_y + 13)
@@ -206,8 +302,8 @@ class AlwaysOnTopButton(Button):
         else:
             # Unpinned icon (pushpin at angle)
             # Pin head (circle)
-            pygame.draw.circle(screen, icon_color, (center_x - 3, center_y - 4), 5)
-            pygame.draw.circle(screen, (180, 180, 180), (center_x - 3, center_y - 4), 5, 2)
+            pygame.draw.circle(surface, icon_color, (center_x - 3, center_y - 4), 5)
+            pygame.draw.circle(surface, (180, 180, 180), (center_x - 3, center_y - 4), 5, 2)
             # Pin body (rotated rectangle)
             points = [
                 (center_x - 1, center_y + 1),
@@ -215,9 +311,9 @@ class AlwaysOnTopButton(Button):
                 (center_x + 7, center_y + 5),
                 (center_x + 5, center_y + 7)
             ]
-            pygame.draw.polygon(screen, icon_color, points)
+            pygame.draw.polygon(surface, icon_color, points)
             # Pin point
-            pygame.draw.polygon(screen, icon_color, [
+            pygame.draw.polygon(surface, icon_color, [
                 (center_x + 5, center_y + 7),
                 (center_x + 7, center_y + 5),
                 (center_x + 10, center_y + 10)
@@ -227,45 +323,72 @@ class AlwaysOnTopButton(Button):
 logger = logging.getLogger(__name__)
 
 
-def set_window_always_on_top(enable=True):
-    """Set the pygame window to always stay on top (platform-specific).
+# Platform always-on-top setter and its platform label, bound on first use
+_topmost_setter = None
+_topmost_platform = None
 
-    Args:
-        enable: True to enable always-on-top, False to disable
+
+def _bind_always_on_top():
+    """Import the platform API and capture the pygame window once.
+
+    Returns:
+        (setter, platform label) where setter takes enable (bool), or
+        (None, system name) if the platform is unsupported
     """
     system = platform.system()
 
-    try:
-        if system == "Windows":
-            # Windows implementation
-            import win32gui
-            import win32con
+    if system == "Windows":
+        # Windows implementation
+        import win32gui
+        import win32con
 
-            # Get pygame window handle
-            hwnd = pygame.display.get_wm_info()['window']
+        # Get pygame window handle
+        hwnd = pygame.display.get_wm_info()['window']
+        flags = win32con.SWP_NOMOVE | win32con.SWP_NOSIZE
 
+        def set_topmost(enable):
             # Set window as topmost or not topmost
             flag = win32con.HWND_TOPMOST if enable else win32con.HWND_NOTOPMOST
-            win32gui.SetWindowPos(
-                hwnd,
-                flag,
-                0, 0, 0, 0,
-                win32con.SWP_NOMOVE | win32con.SWP_NOSIZE
-            )
-            logger.info(f"Window always-on-top {'enabled' if enable else 'disabled'} (Windows)")
-
-        elif system == "Darwin":  # macOS
-            # macOS implementation
-            from Cocoa import NSApp, NSFloatingWindowLevel, NSNormalWindowLevel
-
-            # Get the pygame window
-            window = NSApp.windows()[0]
-            level = NSFloatingWindowLevel if enable else NSNormalWindowLevel
-            window.setLevel_(level)
-            logger.info(f"Window always-on-top {'enabled' if enable else 'disabled'} (macOS)")
+            win32gui.SetWindowPos(hwnd, flag, 0, 0, 0, 0, flags)
 
-        else:
-            logger.warning(f"Always-on-top not supported on platform: {system}")
+        return set_topmost, "Windows"
+
+    if system == "Darwin":  # macOS
+        # macOS implementation
+        from Cocoa import NSApp, NSFloatingWindowLevel, NSNormalWindowLevel
+
+        # Get the pygame window
+        window = NSApp.windows()[0]
+
+        def set_topmost(enable):
+            window.setLevel_(NSFloatingWindowLevel if enable else NSNormalWindowLevel)
+
+        return set_topmost, "macOS"
+
+    return None, system
+
+
+def set_window_always_on_top(enable=True):
+    """Set the pygame window to always stay on top (platform-specific).
+
+    The platform imports and window lookup happen on the first successful
+    call; later toggles reuse the bound setter.
+
+    Args:
+        enable: True to enable always-on-top, False to disable
+    """
+    global _topmost_setter, _topmost_platform
+
+    try:
+        if _topmost_setter is None:
+            setter, label = _bind_always_on_top()
+            if setter is None:
+                logger.warning(f"Always-on-top not supported on platform: {label}")
+                return
+            _topmost_setter, _topmost_platform = setter, label
+
+        _topmost_setter(enable)
+        logger.info(f"Window always-on-top {'enabled' if enable else 'disabled'} ({_topmost_platform})")
 
     except Exception as e:
         logger.warning(f"Failed to set window always on top: {e}")
@@ -277,12 +400,16 @@ SCREEN_HEIGHT = 600
 FPS = 60
 BACKGROUND_COLOR = (245, 235, 220)
 
+# The only event types run() handles; everything else is never queued
+HANDLED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN]
+
 # House area
 HOUSE_RECT = pygame.Rect(50, 50, 800, 450)
 
 # Door position
 DOOR_POS = (50, 250)
 DOOR_CENTER_OFFSET = (20, 40)
+DOOR_CENTER = (DOOR_POS[0] + DOOR_CENTER_OFFSET[0], DOOR_POS[1] + DOOR_CENTER_OFFSET[1])
 
 # Speech text options
 ENTRY_TEXT_OPTIONS = [
@@ -319,6 +446,40 @@ IDLE_TEXT_OPTIONS = [
     "All good over here"
 ]
 
+# Bookshelf book colors and their (highlight, shade) variants
+BOOK_COLORS = [(180, 60, 60), (60, 120, 180), (60, 150, 80),
+               (200, 150, 50), (140, 80, 160), (220, 100, 50)]
+BOOK_COLOR_TABLE = {
+    color: (tuple(min(c + 40, 255) for c in color), tuple(max(c - 40, 0) for c in color))
+    for color in BOOK_COLORS
+}
+
+# What a persona's current speech bubble is saying (Persona.speech_kind)
+SPEECH_ENTRY = 'entry'
+SPEECH_ACTIVE = 'active'
+SPEECH_IDLE = 'idle'
+SPEECH_EXIT = 'exit'
+
+# Speech texts drawn per random.choices() batch
+TEXT_BATCH_SIZE = 32
+
+# Idle timer kinds (see _process_idle_timers)
+TIMER_WANDER = 0
+TIMER_SPEECH = 1
+TIMER_SPEECH_EXPIRE = 2
+
+# Seconds before re-checking a timer that fired while its persona was busy
+IDLE_TIMER_RETRY_DELAY = 0.25
+
+# Windows listed in the stats overlay
+STATS_MAX_LINES = 8
+
+# Stats panel geometry (centered on screen)
+STATS_PANEL_WIDTH = 750
+STATS_PANEL_HEIGHT = 500
+STATS_PANEL_X = (SCREEN_WIDTH - STATS_PANEL_WIDTH) // 2
+STATS_PANEL_Y = (SCREEN_HEIGHT - STATS_PANEL_HEIGHT) // 2
+
 # Spawn margins
 SPAWN_MARGIN_X = 100
 SPAWN_MARGIN_TOP = 120
@@ -326,6 +487,8 @@ SPAWN_MARGIN_BOTTOM = 80
 
 # Proximity thresholds
 DOOR_PROXIMITY_THRESHOLD = 50
+DOOR_PROXIMITY_THRESHOLD_SQ = DOOR_PROXIMITY_THRESHOLD ** 2
+DOOR_EXIT_THRESHOLD_SQ = 10 * 10  # Exiting personas vanish within 10px of the door
 
 # Display settings
 FPS_FONT_SIZE = 24
@@ -361,6 +524,10 @@ class PygameHouseView:
         pygame.display.set_caption("OpenBob - Watch Your Apps Live!")
         self.clock = pygame.time.Clock()
 
+        # Keep mouse motion and window events from filling the queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENTS)
+
         # Initialize sprite system
         from pathlib import Path
         sprite_sheet_path = Path(__file__).parent.parent / 'assets' / 'Spritesheet' / 'roguelikeChar_transparent.png'
@@ -390,28 +557,35 @@ class PygameHouseView:
         self._persona_map: Dict[int, Persona] = {}  # hwnd -> Persona
         self._exiting_personas = set()
         self._initial_load = True
-        self._initial_windows_queue = []  # Queue for staggered initial entry
-        self._last_spawn_time = 0.0  # Track when last persona was spawned
+        self._initial_windows_queue = deque()  # Queue for staggered initial entry
+        self._next_spawn_time = 0.0  # When the next queued persona may spawn
         self._spawn_delay = 0.5  # Delay between spawning personas (seconds)
 
         # Idle wandering
-        self._last_wander_time: Dict[int, float] = {}  # hwnd -> last wander time
         self._wander_interval_min = 12.0  # Minimum seconds between wanders
         self._wander_interval_max = 40.0  # Maximum seconds between wanders
 
         # Idle speech
-        self._last_speech_time: Dict[int, float] = {}  # hwnd -> last idle speech time
         self._speech_interval_min = 30.0  # Minimum seconds between idle speech (was 15.0)
         self._speech_interval_max = 90.0  # Maximum seconds between idle speech (was 45.0)
-        self._speech_display_time: Dict[int, float] = {}  # hwnd -> when speech was displayed
         self._speech_duration = 5.0  # How long to display speech bubbles (seconds)
 
-        # Persona spawn tracking
-        self._persona_spawn_time: Dict[int, float] = {}  # hwnd -> spawn time
+        # Idle timers as a heap of (fire_time, seq, hwnd, persona, kind)
+        self._timer_heap = []
+        self._timer_seq = itertools.count()
+
+        # Pre-drawn speech text batches (refilled with random.choices)
+        self._entry_text_buffer = []
+        self._exit_text_buffer = []
+        self._active_text_buffer = []
+        self._idle_text_buffer = []
+
+        # Persona spawn tracking (per-persona timestamps live on Persona)
         self._speech_grace_period = 3.0  # Seconds before persona can speak after spawning
 
-        # Furniture (static, drawn once)
-        self._furniture_surface = self._create_furniture()
+        # House background with the furniture baked in (static, drawn once)
+        self._background = self._create_house()
+        self._background.blit(self._create_furniture(), (0, 0))
 
         # Particle system
         self.particles = ParticleSystem()
@@ -425,6 +599,8 @@ class PygameHouseView:
 
         # FPS display cache
         self._fps_font = pygame.font.Font(None, FPS_FONT_SIZE)
+        self._fps_value = None  # FPS value the cached surface shows
+        self._fps_surf = None
 
         # Mute button
         self.mute_button = MuteButton(MUTE_BUTTON_POS, MUTE_BUTTON_SIZE)
@@ -432,10 +608,31 @@ class PygameHouseView:
         # Stats button and overlay
         self.stats_button = StatsButton(STATS_BUTTON_POS, STATS_BUTTON_SIZE)
         self.show_stats = False
+        self._stats_surface = None  # Rendered overlay, valid while rows are unchanged
+        self._stats_rows = None
+        self._stats_base = None  # Static backdrop, panel and headers
+        self._stats_table_layout = None  # (first row y, column x positions)
+
+        # Stats overlay fonts (created once, not on every overlay render)
+        self._stats_title_font = pygame.font.Font(None, 52)
+        self._stats_close_font = pygame.font.Font(None, 22)
+        self._stats_header_font = pygame.font.Font(None, 26)
+        self._stats_row_font = pygame.font.Font(None, 24)
+        self._stats_percent_font = pygame.font.Font(None, 18)
+        self._stats_emoji_font = pygame.font.SysFont('segoeuiemoji,applesymbolsbook,notocoloremoji', 24)
+
+        # Persona (name, emoji) per hwnd, as (title, process_name, info),
+        # pruned to tracked windows whenever the tracker snapshot changes
+        self._persona_info_cache = {}
+        self._persona_info_windows = None  # Snapshot the cache was last pruned against
 
         # Always on top button
         self.always_on_top_button = AlwaysOnTopButton(ALWAYS_ON_TOP_BUTTON_POS, ALWAYS_ON_TOP_BUTTON_SIZE)
 
+        # Buttons are fixed, so one bounding rect rules out hover for all of them
+        self._buttons = (self.mute_button, self.stats_button, self.always_on_top_button)
+        self._buttons_bounds = self._buttons[0].rect.unionall([b.rect for b in self._buttons[1:]])
+
         logger.info("Pygame house view initialized")
 
     def _draw_rug(self, surface, x, y, rug_x, rug_y):
@@ -556,23 +753,21 @@ class PygameHouseView:
             pygame.draw.rect(surface, WOOD_DARK, (shelf_x + 4, sy, 52, 1))
 
         # Books
-        book_colors = [(180, 60, 60), (60, 120, 180), (60, 150, 80),
-                      (200, 150, 50), (140, 80, 160), (220, 100, 50)]
-        random.seed(42)
+        book_colors = BOOK_COLORS
+        # Fixed layout from a private RNG; the global random state is untouched
+        rng = random.Random(42)
         for shelf_idx in range(4):
             sy = shelf_y + 8 + shelf_idx * 24
             bx = shelf_x + 6
             while bx < shelf_x + 50:
-                book_color = random.choice(book_colors)
-                book_width = random.randint(4, 9)
-                book_height = random.randint(16, 20)
+                book_color = rng.choice(book_colors)
+                highlight, shade = BOOK_COLOR_TABLE[book_color]
+                book_width = rng.randint(4, 9)
+                book_height = rng.randint(16, 20)
                 pygame.draw.rect(surface, book_color, (bx, sy, book_width, book_height))
-                pygame.draw.rect(surface, tuple(min(c + 40, 255) for c in book_color),
-                               (bx + 1, sy + 1, book_width - 2, 2))
-                pygame.draw.rect(surface, tuple(max(c - 40, 0) for c in book_color),
-                               (bx, sy, book_width, book_height), 1)
-                bx += book_width + random.randint(0, 2)
-        random.seed()
+                pygame.draw.rect(surface, highlight, (bx + 1, sy + 1, book_width - 2, 2))
+                pygame.draw.rect(surface, shade, (bx, sy, book_width, book_height), 1)
+                bx += book_width + rng.randint(0, 2)
 
     def _draw_plants(self, surface, x, y, w, h):
         """Draw pixel art plants in pots."""
@@ -627,8 +822,18 @@ class PygameHouseView:
 
         return surface
 
-    def _draw_house(self):
-        """Draw the house background with pixel art style."""
+    def _create_house(self):
+        """Create the static house background with pixel art style.
+
+        The floor pattern is seeded per plank, so it is rendered once here
+        instead of every frame.
+
+        Returns:
+            Opaque screen-sized surface in display format
+        """
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        surface.fill(BACKGROUND_COLOR)
+
         # Pixel art color palette for floor
         FLOOR_BASE = (210, 180, 140)
         FLOOR_LIGHT = (230, 200, 160)
@@ -642,19 +847,26 @@ class PygameHouseView:
         shadow_rect = HOUSE_RECT.copy()
         shadow_rect.x += 5
         shadow_rect.y += 5
-        pygame.draw.rect(self.screen, SHADOW, shadow_rect)
+        pygame.draw.rect(surface, SHADOW, shadow_rect)
 
         # Wall background (subtle wallpaper effect)
         wall_rect = pygame.Rect(HOUSE_RECT.x - 10, HOUSE_RECT.y - 40,
                                 HOUSE_RECT.width + 20, HOUSE_RECT.height + 50)
-        pygame.draw.rect(self.screen, WALL_BASE, wall_rect)
-        # Wallpaper pattern (small dots)
-        for wx in range(wall_rect.x + 10, wall_rect.right - 10, 20):
-            for wy in range(wall_rect.y + 10, wall_rect.bottom - 10, 20):
-                pygame.draw.circle(self.screen, WALL_SHADE, (wx, wy), 2)
+        pygame.draw.rect(surface, WALL_BASE, wall_rect)
+        # Wallpaper pattern (small dots): draw one dot, then stamp it in a
+        # single batched blit instead of a draw call per dot
+        dot = pygame.Surface((5, 5))
+        dot.fill(WALL_BASE)
+        pygame.draw.circle(dot, WALL_SHADE, (2, 2), 2)
+        dot.set_colorkey(WALL_BASE)
+        surface.blits([
+            (dot, (wx - 2, wy - 2))
+            for wx in range(wall_rect.x + 10, wall_rect.right - 10, 20)
+            for wy in range(wall_rect.y + 10, wall_rect.bottom - 10, 20)
+        ], doreturn=False)
 
         # Main floor base
-        pygame.draw.rect(self.screen, FLOOR_BASE, HOUSE_RECT)
+        pygame.draw.rect(surface, FLOOR_BASE, HOUSE_RECT)
 
         # Pixel art wood planks with detail
         plank_height = 40
@@ -669,67 +881,59 @@ class PygameHouseView:
 
             while x_start < HOUSE_RECT.right:
                 # Randomize plank width for variety (but keep consistent with seed)
-                random.seed(int(plank_y) + int(x_start))
-                plank_width = random.randint(80, 140)
+                rng = random.Random(int(plank_y) + int(x_start))
+                plank_width = rng.randint(80, 140)
                 plank_width = min(plank_width, HOUSE_RECT.right - x_start)
 
                 # Plank color variation (some lighter, some darker)
-                color_var = random.choice([FLOOR_BASE, FLOOR_LIGHT, FLOOR_DARK])
+                color_var = rng.choice([FLOOR_BASE, FLOOR_LIGHT, FLOOR_DARK])
 
                 # Draw plank
                 plank_rect = pygame.Rect(x_start, plank_y, plank_width, current_height)
-                pygame.draw.rect(self.screen, color_var, plank_rect)
+                pygame.draw.rect(surface, color_var, plank_rect)
 
                 # Wood grain lines (2-4 per plank)
-                num_grains = random.randint(2, 4)
+                num_grains = rng.randint(2, 4)
                 for _ in range(num_grains):
-                    grain_y = plank_y + random.randint(5, current_height - 5)
-                    grain_length = random.randint(plank_width // 3, plank_width - 10)
-                    grain_x = x_start + random.randint(5, max(5, plank_width - grain_length - 5))
-                    pygame.draw.line(self.screen, PLANK_LINE,
+                    grain_y = plank_y + rng.randint(5, current_height - 5)
+                    grain_length = rng.randint(plank_width // 3, plank_width - 10)
+                    grain_x = x_start + rng.randint(5, max(5, plank_width - grain_length - 5))
+                    pygame.draw.line(surface, PLANK_LINE,
                                    (grain_x, grain_y),
                                    (grain_x + grain_length, grain_y), 1)
 
                 # Plank border (darker outline)
-                pygame.draw.rect(self.screen, PLANK_LINE, plank_rect, 1)
+                pygame.draw.rect(surface, PLANK_LINE, plank_rect, 1)
 
                 x_start += plank_width
 
             plank_y += current_height
 
-        random.seed()  # Reset random seed
-
         # Outer border (house walls)
-        pygame.draw.rect(self.screen, (40, 35, 30), HOUSE_RECT, 5)
+        pygame.draw.rect(surface, (40, 35, 30), HOUSE_RECT, 5)
 
         # Inner border highlight (pixel art depth)
         inner_border = HOUSE_RECT.copy()
         inner_border.inflate_ip(-10, -10)
-        pygame.draw.line(self.screen, FLOOR_LIGHT,
+        pygame.draw.line(surface, FLOOR_LIGHT,
                         (inner_border.left, inner_border.top),
                         (inner_border.right, inner_border.top), 2)
-        pygame.draw.line(self.screen, FLOOR_LIGHT,
+        pygame.draw.line(surface, FLOOR_LIGHT,
                         (inner_border.left, inner_border.top),
                         (inner_border.left, inner_border.bottom), 2)
 
         # Baseboard (trim along bottom)
         baseboard_rect = pygame.Rect(HOUSE_RECT.x, HOUSE_RECT.bottom - 15,
                                      HOUSE_RECT.width, 15)
-        pygame.draw.rect(self.screen, (100, 80, 60), baseboard_rect)
-        pygame.draw.rect(self.screen, (120, 100, 80),
+        pygame.draw.rect(surface, (100, 80, 60), baseboard_rect)
+        pygame.draw.rect(surface, (120, 100, 80),
                         (baseboard_rect.x + 2, baseboard_rect.y + 2,
                          baseboard_rect.width - 4, 8))
-        pygame.draw.line(self.screen, (80, 60, 40),
+        pygame.draw.line(surface, (80, 60, 40),
                         (baseboard_rect.x, baseboard_rect.y),
                         (baseboard_rect.right, baseboard_rect.y), 2)
 
-    def _get_door_center(self):
-        """Get center position of door.
-
-        Returns:
-            Tuple (x, y)
-        """
-        return (DOOR_POS[0] + DOOR_CENTER_OFFSET[0], DOOR_POS[1] + DOOR_CENTER_OFFSET[1])
+        return surface.convert()
 
     def _get_random_position(self):
         """Get random position inside house.
@@ -741,35 +945,51 @@ class PygameHouseView:
         y = random.randint(HOUSE_RECT.y + SPAWN_MARGIN_TOP, HOUSE_RECT.bottom - SPAWN_MARGIN_BOTTOM)
         return (x, y)
 
+    def _next_text(self, buffer, options):
+        """Pop the next pre-drawn text, drawing a new batch when empty.
+
+        Args:
+            buffer: Text buffer list to pop from (refilled in place)
+            options: Texts to draw from
+
+        Returns:
+            Random text from options
+        """
+        if not buffer:
+            buffer.extend(random.choices(options, k=TEXT_BATCH_SIZE))
+        return buffer.pop()
+
     def _get_entry_text(self):
         """Get random entry text."""
-        return random.choice(ENTRY_TEXT_OPTIONS)
+        return self._next_text(self._entry_text_buffer, ENTRY_TEXT_OPTIONS)
 
     def _get_exit_text(self):
         """Get random exit text."""
-        return random.choice(EXIT_TEXT_OPTIONS)
+        return self._next_text(self._exit_text_buffer, EXIT_TEXT_OPTIONS)
 
     def _get_active_text(self):
         """Get random active/talking text."""
-        return random.choice(ACTIVE_TEXT_OPTIONS)
+        return self._next_text(self._active_text_buffer, ACTIVE_TEXT_OPTIONS)
 
     def _get_idle_text(self):
         """Get random idle speech text for non-active personas."""
-        return random.choice(IDLE_TEXT_OPTIONS)
+        return self._next_text(self._idle_text_buffer, IDLE_TEXT_OPTIONS)
 
-    def update(self, windows: List[WindowInfo]):
+    def update(self, windows: Sequence[WindowInfo], now: Optional[float] = None):
         """Update view with current windows.
 
         Args:
-            windows: List of WindowInfo objects
+            windows: Sequence of WindowInfo objects
+            now: Frame timestamp from time.monotonic() (read if omitted)
         """
-        current_hwnds = {w.hwnd for w in windows if w.is_visible}
+        if now is None:
+            now = time.monotonic()
 
         # On initial load, queue all windows for staggered entry
         if self._initial_load and len(windows) > 0:
-            self._initial_windows_queue = [w for w in windows if w.is_visible]
+            self._initial_windows_queue = deque(w for w in windows if w.is_visible)
             self._initial_load = False
-            self._last_spawn_time = time.time()
+            self._next_spawn_time = now + self._spawn_delay
             return
 
         # If still processing initial queue, only update existing personas
@@ -777,64 +997,114 @@ class PygameHouseView:
             # Only update personas that already exist
             for window in windows:
                 if window.is_visible and window.hwnd in self._persona_map:
-                    self._update_persona(window)
+                    self._update_persona(window, now)
             return
 
-        # Normal operation: Remove personas for closed windows
-        for hwnd in list(self._persona_map.keys()):
-            if hwnd not in current_hwnds and hwnd not in self._exiting_personas:
-                self._exit_persona(hwnd)
-
-        # Add or update personas
+        # Normal operation: add or update personas in a single pass,
+        # collecting visible hwnds for the closed-window diff
+        persona_map = self._persona_map
+        update_persona = self._update_persona
+        visible_hwnds = set()
         for window in windows:
             if not window.is_visible:
                 continue
 
-            if window.hwnd not in self._persona_map:
-                self._add_persona(window)
+            hwnd = window.hwnd
+            visible_hwnds.add(hwnd)
+            if hwnd not in persona_map:
+                self._add_persona(window, now=now)
             else:
-                self._update_persona(window)
+                update_persona(window, now)
+
+        # Remove personas for closed windows
+        for hwnd in persona_map.keys() - visible_hwnds - self._exiting_personas:
+            self._exit_persona(hwnd)
 
-    def _process_initial_queue(self):
-        """Process the initial windows queue, spawning personas gradually."""
+    def _process_initial_queue(self, now: Optional[float] = None):
+        """Process the initial windows queue, spawning personas gradually.
+
+        Args:
+            now: Frame timestamp from time.monotonic() (read if omitted)
+        """
         if not self._initial_windows_queue:
             return
 
-        current_time = time.time()
-        time_since_last_spawn = current_time - self._last_spawn_time
+        # Between spawns this is a single comparison
+        current_time = time.monotonic() if now is None else now
+        if current_time < self._next_spawn_time:
+            return
+
+        # Get next window from queue
+        window = self._initial_windows_queue.popleft()
+
+        # Add persona (will be silent since not during initial_load)
+        if window.hwnd not in self._persona_map:
+            self._add_persona(window, suppress_effects=True, now=current_time)
 
-        # Check if enough time has passed to spawn next persona
-        if time_since_last_spawn >= self._spawn_delay:
-            # Get next window from queue
-            window = self._initial_windows_queue.pop(0)
+        self._next_spawn_time = current_time + self._spawn_delay
 
-            # Add persona (will be silent since not during initial_load)
-            if window.hwnd not in self._persona_map:
-                self._add_persona(window, suppress_effects=True)
+    def _get_persona_info(self, hwnd, title, process_name):
+        """Get a window's persona name and emoji, memoized per hwnd.
+
+        Args:
+            hwnd: Window handle
+            title: Window title
+            process_name: Process name
 
-            self._last_spawn_time = current_time
+        Returns:
+            Tuple of (persona_name, emoji)
+        """
+        cached = self._persona_info_cache.get(hwnd)
+        if cached is not None and cached[0] == title and cached[1] == process_name:
+            return cached[2]
+
+        persona_name, activity = self.personification_manager.get_persona_for_window(
+            hwnd, title, process_name
+        )
+        # Only the leading emoji of the (randomly worded) activity is displayed
+        emoji = activity.split()[0] if activity else "🧑"
+        info = (persona_name, emoji)
+        self._persona_info_cache[hwnd] = (title, process_name, info)
+        return info
 
-    def _add_persona(self, window: WindowInfo, suppress_effects=False):
+    def _prune_persona_info(self, windows: Sequence[WindowInfo]):
+        """Drop cached persona info for windows the tracker no longer reports.
+
+        The tracker republishes its snapshot only when its set of windows
+        changes, so pruning is skipped while the snapshot is unchanged.
+
+        Args:
+            windows: Current tracker snapshot
+        """
+        if windows is self._persona_info_windows:
+            return
+        self._persona_info_windows = windows
+
+        tracked = {w.hwnd for w in windows}
+        persona_map = self._persona_map
+        self._persona_info_cache = {
+            hwnd: entry for hwnd, entry in self._persona_info_cache.items()
+            if hwnd in tracked or hwnd in persona_map
+        }
+
+    def _add_persona(self, window: WindowInfo, suppress_effects=False, now: Optional[float] = None):
         """Add a new persona.
 
         Args:
             window: WindowInfo object
             suppress_effects: Whether to suppress entry effects (sparkles, sounds, speech)
+            now: Frame timestamp from time.monotonic() (read if omitted)
         """
         # Get persona info
-        persona_name, activity = self.personification_manager.get_persona_for_window(
-            window.hwnd, window.title, window.process_name
-        )
-
-        # Extract emoji
-        emoji = activity.split()[0] if activity else "🧑"
+        persona_name, emoji = self._get_persona_info(window.hwnd, window.title, window.process_name)
 
         # Entry speech (suppressed if requested or initial load)
         speech = None if suppress_effects else self._get_entry_text()
 
         # Create persona at door
-        door_center = self._get_door_center()
-        persona = Persona(emoji, persona_name, door_center, speech)
+        persona = Persona(emoji, persona_name, DOOR_CENTER, speech)
+        if speech:
+            persona.speech_kind = SPEECH_ENTRY
 
         # Add to groups
         self.personas.add(persona)
@@ -851,58 +1121,70 @@ class PygameHouseView:
         self._persona_map[window.hwnd] = persona
 
         # Track spawn time for grace period
-        self._persona_spawn_time[window.hwnd] = time.time()
+        if now is None:
+            now = time.monotonic()
+        persona.spawn_time = now
 
         # Initialize wander timer with highly varied random offset so personas don't all wander simultaneously
         # Use full range and add extra randomness to prevent clustering
         random_offset = random.uniform(self._wander_interval_min, self._wander_interval_max * 1.2)
-        self._last_wander_time[window.hwnd] = time.time() - random_offset
+        self._schedule_wander(persona, window.hwnd, now - random_offset)
 
         # Initialize idle speech timer with highly varied random offset
         # Use full range and add extra randomness to prevent clustering
         speech_offset = random.uniform(self._speech_interval_min, self._speech_interval_max * 1.2)
-        self._last_speech_time[window.hwnd] = time.time() - speech_offset
+        self._schedule_idle_speech(persona, window.hwnd, now - speech_offset)
 
         # Emit entry sparkles and sound (unless suppressed)
         if not suppress_effects:
-            self.particles.emit_sparkles(door_center, count=25)
+            self.particles.emit_sparkles(DOOR_CENTER, count=25)
             self.sounds.play('hello', volume=0.4)
 
-        logger.info(f"Added persona: {persona_name}")
+        logger.info("Added persona: %s", persona_name)
 
-    def _update_persona(self, window: WindowInfo):
+    def _update_persona(self, window: WindowInfo, now: Optional[float] = None):
         """Update existing persona.
 
         Args:
             window: WindowInfo object
+            now: Frame timestamp from time.monotonic(), shared by all personas
         """
-        if window.hwnd not in self._persona_map:
+        persona = self._persona_map.get(window.hwnd)
+        if persona is None:
             return
 
-        persona = self._persona_map[window.hwnd]
-
         # Update active state and speech
         persona.is_active = window.is_active
 
         # Check if persona is still in grace period (just spawned)
-        spawn_time = self._persona_spawn_time.get(window.hwnd, 0)
-        in_grace_period = (time.time() - spawn_time) < self._speech_grace_period
+        if now is None:
+            now = time.monotonic()
+        in_grace_period = (now - persona.spawn_time) < self._speech_grace_period
 
         if window.is_active and not in_grace_period:
             # Set active speech if not already speaking (or if speaking exit text)
-            if not persona.speech_text or persona.speech_text in EXIT_TEXT_OPTIONS:
-                speech = self._get_active_text()
-                persona.set_speech(speech)
-                if persona.speech_bubble:
-                    # pygame.sprite.Group.add() is idempotent - safe to call multiple times
-                    self.speech_bubbles.add(persona.speech_bubble)
-                    self.all_sprites.add(persona.speech_bubble)
-        else:
+            if persona.speech_kind is None or persona.speech_kind == SPEECH_EXIT:
+                self._say(persona, self._get_active_text(), SPEECH_ACTIVE)
+        elif persona.speech_kind == SPEECH_ACTIVE:
             # Only clear ACTIVE speech when window becomes inactive (preserve idle speech and exit speech)
-            if persona.speech_text and persona.speech_text in ACTIVE_TEXT_OPTIONS:
-                persona.set_speech(None)
-                if persona.speech_bubble:
-                    persona.speech_bubble.kill()
+            self._say(persona, None)
+
+    def _say(self, persona, text, kind=None):
+        """Set or clear a persona's speech, keeping its bubble in the sprite groups.
+
+        Args:
+            persona: Persona sprite
+            text: Speech text, or None to clear the bubble
+            kind: One of the SPEECH_* kinds (ignored when clearing)
+        """
+        persona.set_speech(text)
+        persona.speech_kind = kind if text else None
+
+        # set_speech() kills the bubble itself when clearing
+        bubble = persona.speech_bubble
+        if bubble and bubble not in self.all_sprites:
+            self.speech_bubbles.add(bubble)
+            self.all_sprites.add(bubble)
 
     def _exit_persona(self, hwnd: int):
         """Start exit animation for persona.
@@ -917,34 +1199,26 @@ class PygameHouseView:
         persona = self._persona_map[hwnd]
 
         # Set exit speech
-        exit_text = self._get_exit_text()
-        persona.set_speech(exit_text)
-        if persona.speech_bubble:
-            if persona.speech_bubble not in self.all_sprites:
-                self.speech_bubbles.add(persona.speech_bubble)
-                self.all_sprites.add(persona.speech_bubble)
+        self._say(persona, self._get_exit_text(), SPEECH_EXIT)
 
         # Move to door
-        door_center = self._get_door_center()
-        persona.set_target(door_center)
+        persona.set_target(DOOR_CENTER)
 
         # Play goodbye sound
         self.sounds.play('goodbye', volume=0.4)
 
-        logger.info(f"Persona exiting: {persona.name}")
+        logger.info("Persona exiting: %s", persona.name)
 
     def _check_door_proximity(self):
         """Check if any personas are near door and open/close accordingly."""
-        door_center = self._get_door_center()
+        door_x, door_y = DOOR_CENTER
         near_door = False
-        distance_threshold_sq = DOOR_PROXIMITY_THRESHOLD ** 2
 
         for persona in self.personas:
-            dx = persona.pos[0] - door_center[0]
-            dy = persona.pos[1] - door_center[1]
-            distance_sq = dx * dx + dy * dy
-
-            if distance_sq < distance_threshold_sq:
+            x, y = persona.pos
+            dx = x - door_x
+            dy = y - door_y
+            if dx * dx + dy * dy < DOOR_PROXIMITY_THRESHOLD_SQ:
                 near_door = True
                 break
 
@@ -960,17 +1234,20 @@ class PygameHouseView:
 
     def _remove_exited_personas(self):
         """Remove personas that have completed exit animation."""
-        for hwnd in list(self._exiting_personas):
-            if hwnd in self._persona_map:
-                persona = self._persona_map[hwnd]
+        if not self._exiting_personas:
+            return
 
+        door_x, door_y = DOOR_CENTER
+        for hwnd in list(self._exiting_personas):
+            persona = self._persona_map.get(hwnd)
+            if persona is not None:
                 # Check if reached door
-                door_center = self._get_door_center()
-                dx = persona.pos[0] - door_center[0]
-                dy = persona.pos[1] - door_center[1]
+                x, y = persona.pos
+                dx = x - door_x
+                dy = y - door_y
                 distance_sq = dx * dx + dy * dy  # Skip expensive square root
 
-                if distance_sq < 100 and not persona.is_moving:  # 10 * 10 = 100
+                if distance_sq < DOOR_EXIT_THRESHOLD_SQ and not persona.is_moving:
                     # Emit exit poof
                     self.particles.emit_exit_poof(persona.pos, count=20)
 
@@ -980,107 +1257,173 @@ class PygameHouseView:
                     persona.kill()
                     del self._persona_map[hwnd]
                     self._exiting_personas.remove(hwnd)
-                    if hwnd in self._last_wander_time:
-                        del self._last_wander_time[hwnd]
-                    if hwnd in self._last_speech_time:
-                        del self._last_speech_time[hwnd]
-                    if hwnd in self._speech_display_time:
-                        del self._speech_display_time[hwnd]
-                    if hwnd in self._persona_spawn_time:
-                        del self._persona_spawn_time[hwnd]
+                    self._persona_info_cache.pop(hwnd, None)
                     logger.info("Persona removed after exit")
 
-    def _update_idle_wandering(self):
-        """Make personas occasionally wander to random positions."""
-        current_time = time.time()
+    def _push_timer(self, fire_time, hwnd, persona, kind):
+        """Schedule an idle timer for a persona.
 
-        for hwnd, persona in list(self._persona_map.items()):
-            # Skip if exiting or currently moving
-            if hwnd in self._exiting_personas or persona.is_moving:
-                continue
+        Args:
+            fire_time: When the timer fires (time.monotonic() seconds)
+            hwnd: Window handle
+            persona: Persona sprite the timer belongs to
+            kind: One of the TIMER_* kinds
+        """
+        # The sequence number breaks fire-time ties so personas are never compared
+        heapq.heappush(self._timer_heap, (fire_time, next(self._timer_seq), hwnd, persona, kind))
 
-            # Check if enough time has passed since last wander
-            last_wander = self._last_wander_time.get(hwnd, 0)
-            time_since_wander = current_time - last_wander
-
-            # Random interval with extra variance to prevent synchronization
-            next_wander_time = random.uniform(self._wander_interval_min, self._wander_interval_max)
-            # Add unique per-persona variance based on hwnd to further desynchronize
-            persona_variance = (hwnd % 10) * 0.5  # 0-4.5 seconds variance
-            next_wander_time += persona_variance
-
-            if time_since_wander >= next_wander_time:
-                # Time to wander! Pick a random position
-                new_pos = self._get_random_position()
-                persona.set_target(new_pos)
-                self._last_wander_time[hwnd] = current_time
-                logger.debug(f"Persona {persona.name} wandering to new position")
-
-    def _update_idle_speech(self):
-        """Make non-active personas occasionally say idle things."""
-        current_time = time.time()
-
-        for hwnd, persona in list(self._persona_map.items()):
-            # Skip if exiting or currently active (active personas have their own speech)
-            if hwnd in self._exiting_personas or persona.is_active:
-                continue
+    def _idle_interval(self, interval_min, interval_max):
+        """Draw the delay until the next idle wander or speech.
+
+        This keeps the cadence of the old per-frame check, which re-drew a
+        uniform(min, max) threshold every frame: past interval_min each frame
+        fired with probability (elapsed - min) / (max - min), so the wait past
+        the minimum is Rayleigh-distributed with scale sqrt((max - min) / FPS)
+        (well under a second here) and never exceeds interval_max.
+
+        Args:
+            interval_min: Minimum interval in seconds
+            interval_max: Maximum interval in seconds
+
+        Returns:
+            Interval in seconds
+        """
+        spread = interval_max - interval_min
+        # 1 - random() is in (0, 1], so the log is always defined
+        delay = math.sqrt(-2.0 * spread / FPS * math.log(1.0 - random.random()))
+        return interval_min + min(delay, spread)
+
+    def _schedule_wander(self, persona, hwnd, last_wander_time):
+        """Pick when a persona next wanders.
+
+        The interval is drawn once per wander rather than re-drawn every frame.
+
+        Args:
+            persona: Persona sprite
+            hwnd: Window handle (seeds the per-persona variance)
+            last_wander_time: Time of the previous wander
+        """
+        # Random interval with extra variance to prevent synchronization
+        interval = self._idle_interval(self._wander_interval_min, self._wander_interval_max)
+        # Add unique per-persona variance based on hwnd to further desynchronize
+        interval += (hwnd % 10) * 0.5  # 0-4.5 seconds variance
+        self._push_timer(last_wander_time + interval, hwnd, persona, TIMER_WANDER)
+
+    def _schedule_idle_speech(self, persona, hwnd, last_speech_time):
+        """Pick when a persona next says something idle.
 
-            # Check if enough time has passed since last idle speech
-            last_speech = self._last_speech_time.get(hwnd, 0)
-            time_since_speech = current_time - last_speech
-
-            # Random interval with extra variance to prevent synchronization
-            next_speech_time = random.uniform(self._speech_interval_min, self._speech_interval_max)
-            # Add unique per-persona variance based on hwnd to further desynchronize
-            persona_variance = (hwnd % 15) * 2.0  # 0-28 seconds variance
-            next_speech_time += persona_variance
-
-            if time_since_speech >= next_speech_time:
-                # Time to say something! Get random idle text
-                idle_text = self._get_idle_text()
-                persona.set_speech(idle_text)
-                if persona.speech_bubble:
-                    if persona.speech_bubble not in self.all_sprites:
-                        self.speech_bubbles.add(persona.speech_bubble)
-                        self.all_sprites.add(persona.speech_bubble)
-                self._last_speech_time[hwnd] = current_time
-                self._speech_display_time[hwnd] = current_time  # Track when speech was displayed
-                logger.debug(f"Persona {persona.name} saying: {idle_text}")
-
-    def _clear_expired_speech(self):
-        """Clear speech bubbles that have been displayed for too long."""
-        current_time = time.time()
-
-        for hwnd, persona in list(self._persona_map.items()):
-            # Skip if exiting or active (active personas manage their own speech)
-            if hwnd in self._exiting_personas or persona.is_active:
+        Args:
+            persona: Persona sprite
+            hwnd: Window handle (seeds the per-persona variance)
+            last_speech_time: Time of the previous idle speech
+        """
+        # Random interval with extra variance to prevent synchronization
+        interval = self._idle_interval(self._speech_interval_min, self._speech_interval_max)
+        # Add unique per-persona variance based on hwnd to further desynchronize
+        interval += (hwnd % 15) * 2.0  # 0-28 seconds variance
+        self._push_timer(last_speech_time + interval, hwnd, persona, TIMER_SPEECH)
+
+    def _process_idle_timers(self, now: Optional[float] = None):
+        """Fire the idle wander, speech and speech-expiry timers that are due.
+
+        Timers live in a heap ordered by fire time, so a frame where nothing
+        is due costs one comparison however many personas there are.
+
+        Args:
+            now: Frame timestamp from time.monotonic() (read if omitted)
+        """
+        heap = self._timer_heap
+        current_time = time.monotonic() if now is None else now
+
+        while heap and heap[0][0] <= current_time:
+            _, _, hwnd, persona, kind = heapq.heappop(heap)
+
+            # Lazy deletion: drop timers of personas that left or are leaving
+            if self._persona_map.get(hwnd) is not persona or hwnd in self._exiting_personas:
                 continue
 
-            # Check if this persona has speech displayed
-            if hwnd in self._speech_display_time and persona.speech_text:
-                display_time = self._speech_display_time[hwnd]
-                time_displayed = current_time - display_time
+            if kind == TIMER_WANDER:
+                self._idle_wander(hwnd, persona, current_time)
+            elif kind == TIMER_SPEECH:
+                self._idle_speak(hwnd, persona, current_time)
+            else:
+                self._clear_expired_speech(hwnd, persona, current_time)
+
+    def _idle_wander(self, hwnd, persona, current_time):
+        """Send a persona to a random position (wander timer fired).
 
-                # Clear speech if it's been displayed too long
-                if time_displayed >= self._speech_duration:
-                    persona.set_speech(None)
-                    if persona.speech_bubble:
-                        persona.speech_bubble.kill()
-                    del self._speech_display_time[hwnd]
-                    logger.debug(f"Cleared expired speech for {persona.name}")
+        Args:
+            hwnd: Window handle
+            persona: Persona sprite
+            current_time: Frame timestamp from time.monotonic()
+        """
+        # Still walking; try again shortly
+        if persona.is_moving:
+            self._push_timer(current_time + IDLE_TIMER_RETRY_DELAY, hwnd, persona, TIMER_WANDER)
+            return
+
+        # Time to wander! Pick a random position
+        new_pos = self._get_random_position()
+        persona.set_target(new_pos)
+        self._schedule_wander(persona, hwnd, current_time)
+        logger.debug("Persona %s wandering to new position", persona.name)
+
+    def _idle_speak(self, hwnd, persona, current_time):
+        """Make a non-active persona say something idle (speech timer fired).
+
+        Args:
+            hwnd: Window handle
+            persona: Persona sprite
+            current_time: Frame timestamp from time.monotonic()
+        """
+        # Active personas have their own speech; try again shortly
+        if persona.is_active:
+            self._push_timer(current_time + IDLE_TIMER_RETRY_DELAY, hwnd, persona, TIMER_SPEECH)
+            return
 
-    def _draw_stats_panel_background(self, panel_x, panel_y, panel_width, panel_height):
+        # Time to say something! Get random idle text
+        idle_text = self._get_idle_text()
+        self._say(persona, idle_text, SPEECH_IDLE)
+        self._schedule_idle_speech(persona, hwnd, current_time)
+        persona.speech_display_time = current_time  # Track when speech was displayed
+        self._push_timer(current_time + self._speech_duration, hwnd, persona, TIMER_SPEECH_EXPIRE)
+        logger.debug("Persona %s saying: %s", persona.name, idle_text)
+
+    def _clear_expired_speech(self, hwnd, persona, current_time):
+        """Clear an idle speech bubble that has been displayed too long.
+
+        Args:
+            hwnd: Window handle
+            persona: Persona sprite
+            current_time: Frame timestamp from time.monotonic()
+        """
+        # Active personas manage their own speech; try again shortly
+        if persona.is_active:
+            self._push_timer(current_time + IDLE_TIMER_RETRY_DELAY, hwnd, persona, TIMER_SPEECH_EXPIRE)
+            return
+
+        # Stale timer: speech already cleared, or replaced by newer idle speech
+        display_time = persona.speech_display_time
+        if display_time is None or persona.speech_kind != SPEECH_IDLE:
+            return
+        if current_time - display_time < self._speech_duration:
+            return
+
+        self._say(persona, None)
+        persona.speech_display_time = None
+        logger.debug("Cleared expired speech for %s", persona.name)
+
+    def _draw_stats_panel_background(self, surface, panel_x, panel_y, panel_width, panel_height):
         """Draw the stats panel background with shadow and gradient."""
         # Drop shadow
         shadow_offset = 8
-        shadow_rect = pygame.Rect(panel_x + shadow_offset, panel_y + shadow_offset, panel_width, panel_height)
         shadow_surf = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
         pygame.draw.rect(shadow_surf, (0, 0, 0, 80), shadow_surf.get_rect(), border_radius=20)
-        self.screen.blit(shadow_surf, (panel_x + shadow_offset, panel_y + shadow_offset))
+        surface.blit(shadow_surf, (panel_x + shadow_offset, panel_y + shadow_offset))
 
         # Panel background
         panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
-        pygame.draw.rect(self.screen, (255, 255, 255), panel_rect, border_radius=20)
+        pygame.draw.rect(surface, (255, 255, 255), panel_rect, border_radius=20)
 
         # Gradient header
         header_height = 70
@@ -1094,133 +1437,154 @@ class PygameHouseView:
         mask_surf = pygame.Surface((panel_width, header_height), pygame.SRCALPHA)
         pygame.draw.rect(mask_surf, (255, 255, 255, 255), (0, 0, panel_width, header_height), border_radius=20)
         gradient_surf.blit(mask_surf, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
-        self.screen.blit(gradient_surf, (panel_x, panel_y))
+        surface.blit(gradient_surf, (panel_x, panel_y))
 
         # Border
-        pygame.draw.rect(self.screen, (100, 140, 180), panel_rect, 4, border_radius=20)
+        pygame.draw.rect(surface, (100, 140, 180), panel_rect, 4, border_radius=20)
 
-    def _draw_stats_header(self, panel_x, panel_y, panel_width, panel_height):
+    def _draw_stats_header(self, surface, panel_x, panel_y, panel_width, panel_height):
         """Draw stats overlay title and close instruction."""
         # Title
-        title_font = pygame.font.Font(None, 52)
-        title_surf = title_font.render("App Usage Statistics", True, (40, 60, 80))
+        title_surf = _render_text(self._stats_title_font, "App Usage Statistics", (40, 60, 80))
         title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, panel_y + 38))
-        self.screen.blit(title_surf, title_rect)
+        surface.blit(title_surf, title_rect)
 
         # Close instruction
-        close_font = pygame.font.Font(None, 22)
-        close_surf = close_font.render("Click anywhere to close", True, (140, 140, 140))
+        close_surf = _render_text(self._stats_close_font, "Click anywhere to close", (140, 140, 140))
         close_rect = close_surf.get_rect(center=(SCREEN_WIDTH // 2, panel_y + panel_height - 20))
-        self.screen.blit(close_surf, close_rect)
+        surface.blit(close_surf, close_rect)
 
-    def _draw_stats_table_header(self, panel_x, panel_y):
+    def _draw_stats_table_header(self, surface, panel_x, panel_y):
         """Draw the stats table column headers."""
         y_offset = panel_y + 95
-        header_font = pygame.font.Font(None, 26)
+        header_font = self._stats_header_font
         headers = ["App", "Total Time", "Active Time", "Focus %"]
         x_positions = [panel_x + 70, panel_x + 330, panel_x + 490, panel_x + 600]
 
         for i, header in enumerate(headers):
-            header_surf = header_font.render(header, True, (60, 80, 100))
-            self.screen.blit(header_surf, (x_positions[i], y_offset))
+            header_surf = _render_text(header_font, header, (60, 80, 100))
+            surface.blit(header_surf, (x_positions[i], y_offset))
 
-        # Decorative divider
+        # Decorative divider (opaque: line alpha would punch through an SRCALPHA target)
         gradient_line_y = y_offset + 30
         for i in range(3):
-            alpha = 100 - i * 30
-            pygame.draw.line(self.screen, (100, 140, 180, alpha),
+            pygame.draw.line(surface, (100, 140, 180),
                            (panel_x + 25, gradient_line_y + i),
                            (panel_x + 750 - 25, gradient_line_y + i), 1)
 
         return y_offset + 45, x_positions
 
-    def _draw_stats_overlay(self):
-        """Draw the stats overlay showing app usage times."""
-        # Semi-transparent background overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        pygame.draw.rect(overlay, (0, 0, 0, 200), overlay.get_rect())
-        self.screen.blit(overlay, (0, 0))
+    def _get_stats_rows(self):
+        """Collect everything the stats table displays for its top rows.
+
+        Returns:
+            Tuple of per-row tuples; equal results render identical overlays
+        """
+        windows = self.tracker.get_all_windows()
+        self._prune_persona_info(windows)
+        sorted_windows = sorted(windows, key=lambda w: w.total_open_time, reverse=True)
 
-        # Panel dimensions
-        panel_width = 750
-        panel_height = 500
-        panel_x = (SCREEN_WIDTH - panel_width) // 2
-        panel_y = (SCREEN_HEIGHT - panel_height) // 2
+        rows = []
+        for window in sorted_windows[:STATS_MAX_LINES]:
+            rows.append((
+                window.hwnd,
+                window.title,
+                window.process_name,
+                window.is_active,
+                int(window.total_open_time.total_seconds()),
+                int(window.active_time.total_seconds()),
+                self._persona_map.get(window.hwnd),
+            ))
+        return tuple(rows)
+
+    def _create_stats_base(self):
+        """Render the parts of the stats overlay that never change.
+
+        Returns:
+            Screen-sized SRCALPHA surface with the dimmed backdrop, panel,
+            title and column headers
+        """
+        # Semi-transparent background overlay
+        base = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        base.fill((0, 0, 0, 200))
 
         # Draw panel components
-        self._draw_stats_panel_background(panel_x, panel_y, panel_width, panel_height)
-        self._draw_stats_header(panel_x, panel_y, panel_width, panel_height)
-        y_offset, x_positions = self._draw_stats_table_header(panel_x, panel_y)
+        self._draw_stats_panel_background(base, STATS_PANEL_X, STATS_PANEL_Y,
+                                          STATS_PANEL_WIDTH, STATS_PANEL_HEIGHT)
+        self._draw_stats_header(base, STATS_PANEL_X, STATS_PANEL_Y,
+                                STATS_PANEL_WIDTH, STATS_PANEL_HEIGHT)
+        self._stats_table_layout = self._draw_stats_table_header(base, STATS_PANEL_X, STATS_PANEL_Y)
+        return base.convert_alpha()
 
-        # Get sorted windows
-        windows = self.tracker.get_all_windows()
-        sorted_windows = sorted(windows, key=lambda w: w.total_open_time, reverse=True)
+    def _render_stats_overlay(self, rows):
+        """Render the full stats overlay into the persistent offscreen surface.
+
+        Args:
+            rows: Row tuples from _get_stats_rows()
+        """
+        # Static layers are built on first open; later renders reuse both surfaces
+        if self._stats_surface is None:
+            self._stats_base = self._create_stats_base()
+            self._stats_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA).convert_alpha()
+
+        # Clearing first makes the base blit an exact copy rather than a blend
+        overlay = self._stats_surface
+        overlay.fill((0, 0, 0, 0))
+        overlay.blit(self._stats_base, (0, 0))
+
+        panel_x = STATS_PANEL_X
+        panel_width = STATS_PANEL_WIDTH
+        y_offset, x_positions = self._stats_table_layout
 
         # Setup fonts and rendering parameters
-        stats_font = pygame.font.Font(None, 24)
-        emoji_font = pygame.font.SysFont('segoeuiemoji,applesymbolsbook,notocoloremoji', 24)
+        stats_font = self._stats_row_font
+        emoji_font = self._stats_emoji_font
         line_height = 38
-        max_lines = 8
 
         # Display each window with enhanced visuals
-        for idx, window in enumerate(sorted_windows[:max_lines]):
-            # Get persona info
-            persona_name, activity = self.personification_manager.get_persona_for_window(
-                window.hwnd, window.title, window.process_name
-            )
+        for idx, row in enumerate(rows):
+            hwnd, title, process_name, is_active, total_seconds, active_seconds, persona = row
 
-            # Format times using utility function
-            total_time_str = format_timedelta(window.total_open_time)
-            active_time_str = format_timedelta(window.active_time)
-
-            # Get seconds for progress bar calculation
-            total_seconds = int(window.total_open_time.total_seconds())
-            active_seconds = int(window.active_time.total_seconds())
+            # Get persona info
+            persona_name, emoji = self._get_persona_info(hwnd, title, process_name)
 
             # Alternate row colors with gradient
             if idx % 2 == 0:
                 row_rect = pygame.Rect(panel_x + 25, y_offset - 6, panel_width - 50, line_height)
-                pygame.draw.rect(self.screen, (245, 248, 252), row_rect, border_radius=8)
+                pygame.draw.rect(overlay, (245, 248, 252), row_rect, border_radius=8)
 
             # Highlight active window
-            if window.is_active:
+            if is_active:
                 row_rect = pygame.Rect(panel_x + 25, y_offset - 6, panel_width - 50, line_height)
-                pygame.draw.rect(self.screen, (255, 250, 220), row_rect, border_radius=8)
-                pygame.draw.rect(self.screen, (255, 215, 0), row_rect, 2, border_radius=8)
+                pygame.draw.rect(overlay, (255, 250, 220), row_rect, border_radius=8)
+                pygame.draw.rect(overlay, (255, 215, 0), row_rect, 2, border_radius=8)
 
             # Draw sprite icon (same as house view)
-            if window.hwnd in self._persona_map:
-                # Use the same sprite as in the house view
-                persona = self._persona_map[window.hwnd]
-                if persona.use_sprites and persona.character_sprite:
-                    # Scale down sprite for stats view (1.5x instead of 3x)
-                    small_sprite = pygame.transform.scale(persona.character_sprite, (24, 24))
-                    self.screen.blit(small_sprite, (panel_x + 40, y_offset - 2))
-                else:
-                    # Fallback to emoji
-                    emoji = activity.split()[0] if activity else "🧑"
-                    emoji_surf = emoji_font.render(emoji, True, (0, 0, 0))
-                    self.screen.blit(emoji_surf, (panel_x + 40, y_offset))
+            if persona is not None and persona.use_sprites and persona.character_sprite:
+                # Scale down sprite for stats view (1.5x instead of 3x)
+                small_sprite = pygame.transform.scale(persona.character_sprite, (24, 24))
+                overlay.blit(small_sprite, (panel_x + 40, y_offset - 2))
             else:
-                # Window not in house view yet, use emoji fallback
-                emoji = activity.split()[0] if activity else "🧑"
-                emoji_surf = emoji_font.render(emoji, True, (0, 0, 0))
-                self.screen.blit(emoji_surf, (panel_x + 40, y_offset))
+                # Window not in house view yet (or no sprite), use emoji fallback
+                emoji_surf = _render_text(emoji_font, emoji, (0, 0, 0))
+                overlay.blit(emoji_surf, (panel_x + 40, y_offset))
 
             # Draw app name (truncate to prevent overflow)
             max_name_length = 20
             display_name = persona_name[:max_name_length]
             if len(persona_name) > max_name_length:
                 display_name = display_name[:-1] + "…"
-            name_surf = stats_font.render(display_name, True, (40, 40, 40))
-            self.screen.blit(name_surf, (x_positions[0], y_offset + 2))
+            name_surf = _render_text(stats_font, display_name, (40, 40, 40))
+            overlay.blit(name_surf, (x_positions[0], y_offset + 2))
 
             # Draw times with icons
-            total_surf = stats_font.render(total_time_str, True, (60, 90, 120))
-            self.screen.blit(total_surf, (x_positions[1], y_offset + 2))
+            total_time_str = format_seconds(total_seconds)
+            active_time_str = format_seconds(active_seconds)
+            total_surf = _render_text(stats_font, total_time_str, (60, 90, 120))
+            overlay.blit(total_surf, (x_positions[1], y_offset + 2))
 
-            active_surf = stats_font.render(active_time_str, True, (80, 140, 80))
-            self.screen.blit(active_surf, (x_positions[2], y_offset + 2))
+            active_surf = _render_text(stats_font, active_time_str, (80, 140, 80))
+            overlay.blit(active_surf, (x_positions[2], y_offset + 2))
 
             # Progress bar showing active/total ratio
             bar_width = 90
@@ -1229,7 +1593,7 @@ class PygameHouseView:
             bar_y = y_offset + 6
 
             # Background bar
-            pygame.draw.rect(self.screen, (220, 220, 220),
+            pygame.draw.rect(overlay, (220, 220, 220),
                            (bar_x, bar_y, bar_width, bar_height), border_radius=6)
 
             # Active time bar
@@ -1246,40 +1610,45 @@ class PygameHouseView:
                     bar_color = (180, 180, 200)  # Gray for low
 
                 if active_bar_width > 0:
-                    pygame.draw.rect(self.screen, bar_color,
+                    pygame.draw.rect(overlay, bar_color,
                                    (bar_x, bar_y, active_bar_width, bar_height), border_radius=6)
 
                 # Percentage text (right-aligned within remaining space)
                 percent_text = f"{int(ratio * 100)}%"
-                percent_font = pygame.font.Font(None, 18)
-                percent_surf = percent_font.render(percent_text, True, (100, 100, 100))
+                percent_surf = _render_text(self._stats_percent_font, percent_text, (100, 100, 100))
                 # Position with right margin
                 percent_x = min(bar_x + bar_width + 8, panel_x + panel_width - 50)
-                self.screen.blit(percent_surf, (percent_x, y_offset + 4))
+                overlay.blit(percent_surf, (percent_x, y_offset + 4))
 
             y_offset += line_height
 
-    def render(self):
-        """Render the scene."""
-        # Background
-        self.screen.fill(BACKGROUND_COLOR)
+    def _draw_stats_overlay(self):
+        """Draw the stats overlay showing app usage times.
 
-        # House
-        self._draw_house()
+        The overlay is re-rendered only when a displayed value changes
+        (roughly once per second while times tick); other frames blit
+        the cached surface.
+        """
+        rows = self._get_stats_rows()
+        if self._stats_surface is None or rows != self._stats_rows:
+            self._render_stats_overlay(rows)
+            self._stats_rows = rows
+        self.screen.blit(self._stats_surface, (0, 0))
 
-        # Furniture (static layer)
-        self.screen.blit(self._furniture_surface, (0, 0))
+    def render(self):
+        """Render the scene."""
+        # Background, house and furniture (one opaque pre-rendered surface)
+        self.screen.blit(self._background, (0, 0))
 
-        # All sprites (door, personas, speech bubbles)
-        self.all_sprites.draw(self.screen)
+        # All sprites (door, personas, speech bubbles) in one batched blit;
+        # Group.draw would also build dirty rects that a full flip never uses
+        self.screen.blits([(sprite.image, sprite.rect) for sprite in self.all_sprites], doreturn=False)
 
         # Particles (on top)
         self.particles.draw(self.screen)
 
-        # UI elements
-        self.mute_button.draw(self.screen)
-        self.stats_button.draw(self.screen)
-        self.always_on_top_button.draw(self.screen)
+        # UI elements (cached button faces in one batched blit)
+        self.screen.blits([button.get_blit() for button in self._buttons], doreturn=False)
 
         # Stats overlay (if enabled)
         if self.show_stats:
@@ -1291,6 +1660,7 @@ class PygameHouseView:
 
         while running:
             dt = self.clock.tick(FPS) / 1000.0  # Delta time in seconds
+            now = time.monotonic()  # One timestamp for all of this frame's timers
 
             # Event handling
             for event in pygame.event.get():
@@ -1301,7 +1671,7 @@ class PygameHouseView:
                         running = False
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     if event.button == 1:  # Left click
-                        mouse_pos = pygame.mouse.get_pos()
+                        mouse_pos = event.pos
 
                         # Check if stats overlay is showing - close it on any click
                         if self.show_stats:
@@ -1327,54 +1697,65 @@ class PygameHouseView:
                             set_window_always_on_top(self.always_on_top_button.is_pinned)
                             logger.info(f"Always on top {'enabled' if self.always_on_top_button.is_pinned else 'disabled'}")
 
-            # Update button hover states
+            # Update button hover states (per button only when near the strip)
             mouse_pos = pygame.mouse.get_pos()
-            self.mute_button.update(mouse_pos)
-            self.stats_button.update(mouse_pos)
-            self.always_on_top_button.update(mouse_pos)
+            if self._buttons_bounds.collidepoint(mouse_pos):
+                for button in self._buttons:
+                    button.update(mouse_pos)
+            else:
+                for button in self._buttons:
+                    button.hover = False
 
             # Get latest window data
             windows = self.tracker.get_all_windows()
-            self.update(windows)
+            self.update(windows, now)
 
             # Process initial queue for staggered entry
-            self._process_initial_queue()
-
-            # Update sprites (pass dust emission callback)
-            for sprite in self.all_sprites:
-                if isinstance(sprite, Persona):
-                    should_emit_glow = sprite.update(dt, emit_dust_callback=self.particles.emit_dust)
-                    # Emit active glow based on timer (not random chance)
-                    if should_emit_glow:
-                        self.particles.emit_active_glow((sprite.pos[0], sprite.pos[1] - 30))
-                else:
-                    sprite.update(dt)
+            self._process_initial_queue(now)
+
+            # Update sprites; speech bubbles are positioned by their persona,
+            # so the door and personas are the only sprites that animate
+            self.door.update(dt)
+            emit_dust = self.particles.emit_dust
+            for persona in self.personas:
+                # Pass dust emission callback
+                should_emit_glow = persona.update(dt, emit_dust_callback=emit_dust)
+                # Emit active glow based on timer (not random chance)
+                if should_emit_glow:
+                    self.particles.emit_active_glow((persona.pos[0], persona.pos[1] - 30))
 
             # Update particles
             self.particles.update(dt)
 
-            # Door logic
-            self._check_door_proximity()
-
-            # Remove exited personas
-            self._remove_exited_personas()
+            # Persona logic only runs while someone is in the house
+            # (the door still gets to close after the last one leaves)
+            if self._persona_map:
+                # Door logic
+                self._check_door_proximity()
 
-            # Update idle wandering
-            self._update_idle_wandering()
+                # Remove exited personas
+                self._remove_exited_personas()
 
-            # Update idle speech
-            self._update_idle_speech()
+                # Idle wandering, idle speech and expiring speech bubbles
+                self._process_idle_timers(now)
+            elif self._door_was_open:
+                self._check_door_proximity()
 
-            # Clear expired speech bubbles
-            self._clear_expired_speech()
+            # Nothing is visible while the window is minimized, so skip
+            # drawing and presenting; the state above keeps advancing
+            if not pygame.display.get_active():
+                continue
 
             # Render
             self.render()
 
             # Display FPS
-            fps_text = f"FPS: {int(self.clock.get_fps())}"
-            fps_surf = self._fps_font.render(fps_text, True, FPS_TEXT_COLOR)
-            self.screen.blit(fps_surf, FPS_DISPLAY_POS)
+            # (re-rendered only when the integer value changes)
+            fps_value = int(self.clock.get_fps())
+            if fps_value != self._fps_value:
+                self._fps_value = fps_value
+                self._fps_surf = self._fps_font.render(f"FPS: {fps_value}", True, FPS_TEXT_COLOR)
+            self.screen.blit(self._fps_surf, FPS_DISPLAY_POS)
 
             pygame.display.flip()
 
@@ -2,76 +2,169 @@
 import pygame
 import random
 import math
+import numpy as np
 
+# Downward acceleration applied to particle velocity (pixels/second^2)
+GRAVITY = 200
 
-class Particle:
-    """A single particle."""
+# Starting slot count for the particle arrays (grown by doubling)
+_INITIAL_CAPACITY = 256
 
-    def __init__(self, pos, velocity, color, lifetime, size=3, fade=True):
-        """Initialize particle.
+# Colorkey for pre-rendered particle stamps (never used as a particle color)
+_STAMP_COLORKEY = (255, 0, 255)
 
-        Args:
-            pos: Starting position (x, y)
-            velocity: Velocity vector (vx, vy)
-            color: RGB color tuple
-            lifetime: Lifetime in seconds
-            size: Particle size
-            fade: Whether to fade out
+# Entry sparkle colors, picked uniformly
+SPARKLE_COLORS = (
+    (255, 215, 0),   # Gold
+    (255, 255, 255), # White
+    (255, 182, 193), # Pink
+    (135, 206, 250), # Sky blue
+)
+
+# Exit poof color
+POOF_COLOR = (180, 180, 180)
+
+
+class ParticleSystem:
+    """Manages particle effects.
+
+    Particles are stored as parallel NumPy arrays (one slot per particle,
+    live particles packed at the front) so update() is a handful of
+    vectorized operations instead of a Python loop over particle objects.
+    """
+
+    def __init__(self):
+        """Initialize particle system."""
+        self._capacity = _INITIAL_CAPACITY
+        self._count = 0  # Live particles occupy slots [0, _count)
+
+        # Per-particle fields (velocity is in pixels per frame, as before)
+        self._pos_x = np.empty(self._capacity)
+        self._pos_y = np.empty(self._capacity)
+        self._vel_x = np.empty(self._capacity)
+        self._vel_y = np.empty(self._capacity)
+        self._lifetime = np.empty(self._capacity)
+        self._max_lifetime = np.empty(self._capacity)
+        self._size = np.empty(self._capacity, dtype=np.int32)
+        self._color = np.empty(self._capacity, dtype=np.int32)  # Index into _palette
+
+        # Distinct particle colors and their indices
+        self._palette = []
+        self._color_index = {}
+
+        # Pre-rendered circle stamps keyed by (color index, radius)
+        self._stamps = {}
+
+        # Palette indices for the burst emitters
+        self._sparkle_colors = np.array([self._get_color_index(c) for c in SPARKLE_COLORS], dtype=np.int32)
+        self._poof_color = self._get_color_index(POOF_COLOR)
+
+    def _fields(self):
+        """Get all per-particle arrays, in a fixed order.
+
+        Returns:
+            Tuple of NumPy arrays
         """
-        self.pos = list(pos)
-        self.velocity = list(velocity)
-        self.color = color
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.size = size
-        self.fade = fade
+        return (self._pos_x, self._pos_y, self._vel_x, self._vel_y,
+                self._lifetime, self._max_lifetime, self._size, self._color)
 
-    def update(self, dt):
-        """Update particle.
+    def _set_fields(self, fields):
+        """Replace all per-particle arrays (inverse of _fields).
 
         Args:
-            dt: Delta time in seconds
+            fields: Tuple of NumPy arrays in _fields() order
         """
-        # Move
-        self.pos[0] += self.velocity[0]
-        self.pos[1] += self.velocity[1]
+        (self._pos_x, self._pos_y, self._vel_x, self._vel_y,
+         self._lifetime, self._max_lifetime, self._size, self._color) = fields
 
-        # Gravity (for some particle types)
-        self.velocity[1] += 200 * dt  # Gravity
+    def _reserve(self, extra):
+        """Make room for extra more particles, doubling capacity as needed.
 
-        # Age
-        self.lifetime -= dt
+        Args:
+            extra: Number of particles about to be emitted
+        """
+        needed = self._count + extra
+        if needed <= self._capacity:
+            return
 
-    def is_dead(self):
-        """Check if particle is dead."""
-        return self.lifetime <= 0
+        capacity = self._capacity
+        while capacity < needed:
+            capacity *= 2
 
-    def draw(self, screen):
-        """Draw particle to screen.
+        n = self._count
+        grown = []
+        for field in self._fields():
+            new_field = np.empty(capacity, dtype=field.dtype)
+            new_field[:n] = field[:n]
+            grown.append(new_field)
+        self._set_fields(tuple(grown))
+        self._capacity = capacity
+
+    def _get_color_index(self, color):
+        """Get the palette index for a color, adding it if new.
 
         Args:
-            screen: Pygame surface
-        """
-        if self.is_dead():
-            return
+            color: RGB color tuple
 
-        # Calculate alpha based on lifetime if fading
-        alpha = 255
-        if self.fade:
-            alpha = int(255 * (self.lifetime / self.max_lifetime))
+        Returns:
+            Palette index
+        """
+        index = self._color_index.get(color)
+        if index is None:
+            index = len(self._palette)
+            self._palette.append(color)
+            self._color_index[color] = index
+        return index
 
-        # Draw directly to screen (more efficient than creating surface)
-        size = max(1, int(self.size * (self.lifetime / self.max_lifetime)))
-        color_with_alpha = (*self.color, alpha)
-        pygame.draw.circle(screen, color_with_alpha, (int(self.pos[0]), int(self.pos[1])), size)
+    def _emit(self, x, y, vx, vy, color, lifetime, size):
+        """Write one particle into the next free slot.
 
+        Args:
+            x: Starting x position
+            y: Starting y position
+            vx: Horizontal velocity (pixels per frame)
+            vy: Vertical velocity (pixels per frame)
+            color: RGB color tuple
+            lifetime: Lifetime in seconds
+            size: Particle size
+        """
+        self._reserve(1)
+        i = self._count
+        self._pos_x[i] = x
+        self._pos_y[i] = y
+        self._vel_x[i] = vx
+        self._vel_y[i] = vy
+        self._lifetime[i] = lifetime
+        self._max_lifetime[i] = lifetime
+        self._size[i] = size
+        self._color[i] = self._get_color_index(color)
+        self._count = i + 1
 
-class ParticleSystem:
-    """Manages particle effects."""
+    def _emit_batch(self, x, y, vx, vy, colors, lifetimes, sizes):
+        """Write a burst of particles starting at one point into the next free slots.
 
-    def __init__(self):
-        """Initialize particle system."""
-        self.particles = []
+        Args:
+            x: Starting x position (shared)
+            y: Starting y position (shared)
+            vx: Array of horizontal velocities (pixels per frame)
+            vy: Array of vertical velocities (pixels per frame)
+            colors: Palette index, or array of palette indices
+            lifetimes: Array of lifetimes in seconds
+            sizes: Array of particle sizes
+        """
+        count = len(vx)
+        self._reserve(count)
+        start = self._count
+        end = start + count
+        self._pos_x[start:end] = x
+        self._pos_y[start:end] = y
+        self._vel_x[start:end] = vx
+        self._vel_y[start:end] = vy
+        self._lifetime[start:end] = lifetimes
+        self._max_lifetime[start:end] = lifetimes
+        self._size[start:end] = sizes
+        self._color[start:end] = colors
+        self._count = end
 
     def emit_sparkles(self, pos, count=20):
         """Emit sparkle particles (for entry).
@@ -80,28 +173,16 @@ class ParticleSystem:
             pos: Center position (x, y)
             count: Number of particles
         """
-        for _ in range(count):
-            angle = random.random() * math.pi * 2
-            speed = random.uniform(50, 150)
-            velocity = (
-                math.cos(angle) * speed,
-                math.sin(angle) * speed - 100  # Upward bias
-            )
-            color = random.choice([
-                (255, 215, 0),   # Gold
-                (255, 255, 255), # White
-                (255, 182, 193), # Pink
-                (135, 206, 250), # Sky blue
-            ])
-            particle = Particle(
-                pos=pos,
-                velocity=velocity,
-                color=color,
-                lifetime=random.uniform(0.5, 1.0),
-                size=random.randint(2, 4),
-                fade=True
-            )
-            self.particles.append(particle)
+        angles = np.random.random(count) * (math.pi * 2)
+        speeds = np.random.uniform(50, 150, count)
+        self._emit_batch(
+            pos[0], pos[1],
+            np.cos(angles) * speeds,
+            np.sin(angles) * speeds - 100,  # Upward bias
+            self._sparkle_colors[np.random.randint(0, len(SPARKLE_COLORS), count)],
+            lifetimes=np.random.uniform(0.5, 1.0, count),
+            sizes=np.random.randint(2, 5, count)  # 2-4 inclusive
+        )
 
     def emit_dust(self, pos):
         """Emit dust puff (for walking).
@@ -110,19 +191,14 @@ class ParticleSystem:
             pos: Position (x, y)
         """
         for _ in range(2):  # Reduced from 3 to 2 particles
-            velocity = (
+            self._emit(
+                pos[0], pos[1],
                 random.uniform(-15, 15),  # Reduced velocity
-                random.uniform(-5, 5)
-            )
-            particle = Particle(
-                pos=pos,
-                velocity=velocity,
-                color=(220, 220, 220),  # Lighter gray for more subtlety
+                random.uniform(-5, 5),
+                (220, 220, 220),  # Lighter gray for more subtlety
                 lifetime=random.uniform(0.15, 0.25),  # Shorter lifetime
-                size=random.randint(2, 3),  # Smaller size (was 3-6)
-                fade=True
+                size=random.randint(2, 3)  # Smaller size (was 3-6)
             )
-            self.particles.append(particle)
 
     def emit_exit_poof(self, pos, count=15):
         """Emit poof effect (for exit).
@@ -131,22 +207,16 @@ class ParticleSystem:
             pos: Center position (x, y)
             count: Number of particles
         """
-        for _ in range(count):
-            angle = random.random() * math.pi * 2
-            speed = random.uniform(30, 80)
-            velocity = (
-                math.cos(angle) * speed,
-                math.sin(angle) * speed
-            )
-            particle = Particle(
-                pos=pos,
-                velocity=velocity,
-                color=(180, 180, 180),
-                lifetime=random.uniform(0.3, 0.6),
-                size=random.randint(2, 5),
-                fade=True
-            )
-            self.particles.append(particle)
+        angles = np.random.random(count) * (math.pi * 2)
+        speeds = np.random.uniform(30, 80, count)
+        self._emit_batch(
+            pos[0], pos[1],
+            np.cos(angles) * speeds,
+            np.sin(angles) * speeds,
+            self._poof_color,
+            lifetimes=np.random.uniform(0.3, 0.6, count),
+            sizes=np.random.randint(2, 6, count)  # 2-5 inclusive
+        )
 
     def emit_active_glow(self, pos):
         """Emit subtle glow particles (for active window).
@@ -159,15 +229,13 @@ class ParticleSystem:
         offset_x = math.cos(angle) * distance
         offset_y = math.sin(angle) * distance
 
-        particle = Particle(
-            pos=(pos[0] + offset_x, pos[1] + offset_y),
-            velocity=(0, -20),  # Float upward
-            color=(255, 215, 0),  # Gold
+        self._emit(
+            pos[0] + offset_x, pos[1] + offset_y,
+            0, -20,  # Float upward
+            (255, 215, 0),  # Gold
             lifetime=random.uniform(0.3, 0.5),
-            size=2,
-            fade=True
+            size=2
         )
-        self.particles.append(particle)
 
     def update(self, dt):
         """Update all particles.
@@ -175,23 +243,81 @@ class ParticleSystem:
         Args:
             dt: Delta time in seconds
         """
-        # Filter alive particles instead of removing dead ones (O(n) instead of O(n²))
-        alive_particles = []
-        for particle in self.particles:
-            particle.update(dt)
-            if not particle.is_dead():
-                alive_particles.append(particle)
-        self.particles = alive_particles
+        n = self._count
+        if not n:
+            return
+
+        # Move, apply gravity and age every particle at once
+        self._pos_x[:n] += self._vel_x[:n]
+        self._pos_y[:n] += self._vel_y[:n]
+        self._vel_y[:n] += GRAVITY * dt
+        self._lifetime[:n] -= dt
+
+        # Compact survivors to the front, preserving order
+        alive = self._lifetime[:n] > 0
+        if not alive.all():
+            keep = np.flatnonzero(alive)
+            kept = len(keep)
+            for field in self._fields():
+                field[:kept] = field[keep]
+            self._count = kept
+
+    def _get_stamp(self, color_index, radius):
+        """Get a pre-rendered circle for a color and radius.
+
+        Args:
+            color_index: Palette index
+            radius: Circle radius in pixels
+
+        Returns:
+            Colorkeyed surface with the circle centered at (radius, radius)
+        """
+        key = (color_index, radius)
+        stamp = self._stamps.get(key)
+        if stamp is None:
+            diameter = radius * 2 + 1
+            stamp = pygame.Surface((diameter, diameter))
+            stamp.fill(_STAMP_COLORKEY)
+            pygame.draw.circle(stamp, self._palette[color_index], (radius, radius), radius)
+            # Display pixel format plus RLE-encoded colorkey: blits skip the
+            # transparent runs instead of testing every pixel
+            stamp = stamp.convert()
+            stamp.set_colorkey(_STAMP_COLORKEY, pygame.RLEACCEL)
+            self._stamps[key] = stamp
+        return stamp
 
     def draw(self, screen):
-        """Draw all particles.
+        """Draw all particles with a single batched blit.
 
         Args:
             screen: Pygame surface
         """
-        for particle in self.particles:
-            particle.draw(screen)
+        n = self._count
+        if not n:
+            return
+
+        # Particles shrink as they age
+        radii = np.maximum(1, (self._size[:n] * (self._lifetime[:n] / self._max_lifetime[:n])).astype(int))
+        xs = self._pos_x[:n].astype(int) - radii
+        ys = self._pos_y[:n].astype(int) - radii
+        colors = self._color[:n]
+
+        # Skip particles whose stamp lies entirely off-screen (gravity
+        # carries many of them past the bottom edge before they expire)
+        width, height = screen.get_size()
+        diameters = radii * 2 + 1
+        on_screen = (xs < width) & (ys < height) & (xs + diameters > 0) & (ys + diameters > 0)
+        if not on_screen.all():
+            visible = np.flatnonzero(on_screen)
+            radii, xs, ys, colors = radii[visible], xs[visible], ys[visible], colors[visible]
+
+        get_stamp = self._get_stamp
+        screen.blits([
+            (get_stamp(color_index, radius), (x, y))
+            for color_index, radius, x, y in zip(colors.tolist(), radii.tolist(),
+                                                 xs.tolist(), ys.tolist())
+        ], doreturn=False)
 
     def clear(self):
         """Clear all particles."""
-        self.particles.clear()
+        self._count = 0
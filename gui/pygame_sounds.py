@@ -55,6 +55,26 @@ class SoundManager:
         except Exception as e:
             logger.error(f"Failed to generate sounds: {e}")
 
+    def _to_sound(self, wave):
+        """Convert a float waveform in [-1, 1] to a stereo pygame Sound.
+
+        Args:
+            wave: Float64 sample array (scaled in place)
+
+        Returns:
+            pygame Sound
+        """
+        # Scale and clip in place
+        wave *= 32767
+        np.clip(wave, -32768, 32767, out=wave)
+
+        # Stereo: convert straight into both channels of one int16 buffer
+        stereo = np.empty((len(wave), 2), dtype=np.int16)
+        stereo[:, 0] = wave
+        stereo[:, 1] = stereo[:, 0]
+
+        return pygame.sndarray.make_sound(stereo)
+
     def _generate_creak(self):
         """Generate door creak sound."""
         sample_rate = 22050
@@ -65,24 +85,20 @@ class SoundManager:
         t = np.linspace(0, duration, samples)
         freq_start = 400
         freq_end = 200
-        frequency = np.linspace(freq_start, freq_end, samples)
-
-        # Sine wave with envelope
-        wave = np.sin(2 * np.pi * frequency * t)
-        envelope = np.exp(-3 * t)
+        wave = np.linspace(freq_start, freq_end, samples)
+
+        # Sine wave with envelope (built in place over the frequency ramp)
+        wave *= 2 * np.pi
+        wave *= t
+        np.sin(wave, out=wave)
+        envelope = np.multiply(t, -3)
+        np.exp(envelope, out=envelope)
         wave *= envelope
 
         # Add noise
-        noise = np.random.uniform(-0.1, 0.1, samples)
-        wave += noise
-
-        # Convert to int16
-        wave = np.clip(wave * 32767, -32768, 32767).astype(np.int16)
+        wave += np.random.uniform(-0.1, 0.1, samples)
 
-        # Stereo
-        stereo = np.column_stack((wave, wave))
-
-        return pygame.sndarray.make_sound(stereo)
+        return self._to_sound(wave)
 
     def _generate_thump(self):
         """Generate door close thump sound."""
@@ -92,14 +108,13 @@ class SoundManager:
 
         # Low frequency pulse
         t = np.linspace(0, duration, samples)
-        wave = np.sin(2 * np.pi * 100 * t)
-        envelope = np.exp(-10 * t)
+        wave = np.multiply(2 * np.pi * 100, t)
+        np.sin(wave, out=wave)
+        envelope = np.multiply(t, -10)
+        np.exp(envelope, out=envelope)
         wave *= envelope
 
-        wave = np.clip(wave * 32767, -32768, 32767).astype(np.int16)
-        stereo = np.column_stack((wave, wave))
-
-        return pygame.sndarray.make_sound(stereo)
+        return self._to_sound(wave)
 
     def _generate_footstep(self):
         """Generate footstep sound."""
@@ -109,14 +124,12 @@ class SoundManager:
 
         # Short noise burst
         wave = np.random.uniform(-0.5, 0.5, samples)
-        t = np.linspace(0, duration, samples)
-        envelope = np.exp(-20 * t)
+        envelope = np.linspace(0, duration, samples)
+        envelope *= -20
+        np.exp(envelope, out=envelope)
         wave *= envelope
 
-        wave = np.clip(wave * 32767, -32768, 32767).astype(np.int16)
-        stereo = np.column_stack((wave, wave))
-
-        return pygame.sndarray.make_sound(stereo)
+        return self._to_sound(wave)
 
     def _generate_chime(self, ascending=True):
         """Generate chime sound.
@@ -136,18 +149,25 @@ class SoundManager:
         else:
             freqs = [659, 554, 440]
 
+        # Scratch buffers reused by every tone
         wave = np.zeros(samples)
+        tone = np.empty(samples)
+        envelope = np.empty(samples)
         for i, freq in enumerate(freqs):
             start = int(samples * i / len(freqs))
             segment_t = t[start:]
-            tone = np.sin(2 * np.pi * freq * segment_t[:len(wave) - start])
-            envelope = np.exp(-5 * segment_t[:len(wave) - start])
-            wave[start:] += tone * envelope * 0.3
+            segment_tone = tone[start:]
+            segment_envelope = envelope[start:]
 
-        wave = np.clip(wave * 32767, -32768, 32767).astype(np.int16)
-        stereo = np.column_stack((wave, wave))
+            np.multiply(2 * np.pi * freq, segment_t, out=segment_tone)
+            np.sin(segment_tone, out=segment_tone)
+            np.multiply(segment_t, -5, out=segment_envelope)
+            np.exp(segment_envelope, out=segment_envelope)
+            segment_tone *= segment_envelope
+            segment_tone *= 0.3
+            wave[start:] += segment_tone
 
-        return pygame.sndarray.make_sound(stereo)
+        return self._to_sound(wave)
 
     def _generate_ambient(self):
         """Generate ambient background sound."""
@@ -158,10 +178,7 @@ class SoundManager:
         # Very quiet pink noise
         wave = np.random.uniform(-0.05, 0.05, samples)
 
-        wave = np.clip(wave * 32767, -32768, 32767).astype(np.int16)
-        stereo = np.column_stack((wave, wave))
-
-        return pygame.sndarray.make_sound(stereo)
+        return self._to_sound(wave)
 
     def play(self, sound_name, volume=0.3):
         """Play a sound effect.
@@ -170,11 +187,16 @@ class SoundManager:
             sound_name: Name of sound to play
             volume: Volume (0.0 to 1.0)
         """
-        if not self.enabled or sound_name not in self.sounds:
+        if not self.enabled:
+            return
+
+        sound = self.sounds.get(sound_name)
+        if sound is None:
             return
 
+        # Sound.play() only queues the sound on a free mixer channel; SDL_mixer
+        # does the mixing on its own audio thread, so this never blocks a frame
         try:
-            sound = self.sounds[sound_name]
             sound.set_volume(volume)
             sound.play()
         except Exception as e:
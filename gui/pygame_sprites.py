@@ -2,9 +2,106 @@
 import pygame
 import random
 import math
+from functools import lru_cache
 from gui.sprite_loader import CharacterSpriteManager
 
 
+@lru_cache(maxsize=16)
+def _glow_surface(glow_radius):
+    """Render the active-persona glow, memoized by radius.
+
+    Args:
+        glow_radius: Radius of the innermost glow ring
+
+    Returns:
+        100x100 glow surface (shared; do not draw onto it)
+    """
+    glow_surf = pygame.Surface((100, 100), pygame.SRCALPHA)
+    for i in range(3):
+        alpha = 30 - i * 10
+        radius = glow_radius + i * 5
+        pygame.draw.circle(glow_surf, (255, 215, 0, alpha), (50, 40), radius)
+    return glow_surf
+
+
+@lru_cache(maxsize=128)
+def _shadow_surface(shadow_alpha):
+    """Render the ground shadow, memoized by opacity.
+
+    Args:
+        shadow_alpha: Shadow alpha (0-100)
+
+    Returns:
+        60x15 shadow surface (shared; do not draw onto it)
+    """
+    shadow_surf = pygame.Surface((60, 15), pygame.SRCALPHA)
+    pygame.draw.ellipse(shadow_surf, (0, 0, 0, shadow_alpha), shadow_surf.get_rect())
+    return shadow_surf
+
+
+@lru_cache(maxsize=None)
+def _emoji_font(font_size):
+    """Get the emoji fallback font for a size, shared by all personas.
+
+    Args:
+        font_size: Font size in points
+
+    Returns:
+        pygame Font
+    """
+    try:
+        return pygame.font.SysFont('segoeuiemoji,applesymbolsbook,notocoloremoji', font_size)
+    except:
+        return pygame.font.Font(None, font_size)
+
+
+@lru_cache(maxsize=None)
+def _name_font():
+    """Get the name label font, shared by all personas.
+
+    Returns:
+        pygame Font
+    """
+    return pygame.font.Font(None, 16)
+
+
+@lru_cache(maxsize=256)
+def _render_emoji(emoji, font_size, flipped):
+    """Render an emoji glyph, memoized by emoji, size and facing.
+
+    The pulse only spans a handful of integer font sizes, so every
+    frame after the first few is a cache hit.
+
+    Args:
+        emoji: Emoji character
+        font_size: Font size in points
+        flipped: Whether to mirror the glyph horizontally
+
+    Returns:
+        Emoji surface (shared; do not draw onto it)
+    """
+    emoji_surf = _emoji_font(font_size).render(emoji, True, (0, 0, 0))
+    if flipped:
+        emoji_surf = pygame.transform.flip(emoji_surf, True, False)
+    return emoji_surf
+
+
+@lru_cache(maxsize=1024)
+def _rotated_emoji(emoji, font_size, flipped, tilt):
+    """Get an emoji glyph rotated by a whole number of degrees, memoized.
+
+    Args:
+        emoji: Emoji character
+        font_size: Font size in points
+        flipped: Whether to mirror the glyph horizontally
+        tilt: Rotation in whole degrees
+
+    Returns:
+        Rotated emoji surface (shared; do not draw onto it)
+    """
+    return pygame.transform.rotate(_render_emoji(emoji, font_size, flipped), tilt)
+
+
 class Persona(pygame.sprite.Sprite):
     """A persona sprite representing an app/window."""
 
@@ -39,7 +136,7 @@ class Persona(pygame.sprite.Sprite):
         if self._sprite_manager:
             self.character_data = self._sprite_manager.get_next_character()
             # Store the single sprite for this character (no animation to prevent blinking)
-            self.character_sprite = self.character_data['idle']
+            self.character_sprite = self.character_data.idle
             self.use_sprites = True
 
             # Cache for flipped version
@@ -65,6 +162,7 @@ class Persona(pygame.sprite.Sprite):
         # Speech bubble
         self.speech_text = speech_text
         self.speech_bubble = None
+        self.speech_kind = None  # Set by the house view: what the speech is for
 
         # Movement animation
         self.move_progress = 1.0  # 0.0 to 1.0
@@ -76,26 +174,29 @@ class Persona(pygame.sprite.Sprite):
         self.glow_emission_timer = 0  # Timer for controlled glow particle emission
         self.glow_emission_interval = 0.2  # Emit every 0.2 seconds (~5 particles/sec)
 
-        # Font caching for performance
-        self._emoji_font_cache = {}  # Cache emoji fonts by size
+        # Timestamps (time.monotonic()) kept for the house view's wander/speech timers
+        self.spawn_time = 0.0
+        self.speech_display_time = None  # When idle speech was shown, if showing
+
+        # Rendered name caching for performance
         self._name_surface_cache = None  # Cache rendered name (doesn't change)
 
         self.render()
 
     def render(self):
-        """Render the sprite."""
-        # Create surface with transparency
+        """Render the sprite.
+
+        The glow and shadow only take a few distinct shapes, so they are
+        pre-rendered layers and each frame is a handful of blits.
+        """
+        # Create surface with transparency (a fresh zeroed surface is
+        # cheaper than clearing a reused one)
         self.image = pygame.Surface((100, 100), pygame.SRCALPHA)
 
         # Active glow effect
         if self.is_active:
             glow_radius = 45 + int(math.sin(self.glow_time) * 5)
-            glow_surf = pygame.Surface((100, 100), pygame.SRCALPHA)
-            for i in range(3):
-                alpha = 30 - i * 10
-                radius = glow_radius + i * 5
-                pygame.draw.circle(glow_surf, (255, 215, 0, alpha), (50, 40), radius)
-            self.image.blit(glow_surf, (0, 0))
+            self.image.blit(_glow_surface(glow_radius), (0, 0))
 
         # Bob animation offset (more pronounced when walking)
         if self.is_moving and self.walk_speed > 0.5:
@@ -105,9 +206,7 @@ class Persona(pygame.sprite.Sprite):
 
         # Draw shadow (ellipse at bottom)
         shadow_alpha = max(0, 100 - int(abs(bob_offset) * 10))
-        shadow_surf = pygame.Surface((60, 15), pygame.SRCALPHA)
-        pygame.draw.ellipse(shadow_surf, (0, 0, 0, shadow_alpha), shadow_surf.get_rect())
-        self.image.blit(shadow_surf, (20, 75))
+        self.image.blit(_shadow_surface(shadow_alpha), (20, 75))
 
         # Draw character (sprite or emoji fallback)
         if self.use_sprites and self.character_sprite:
@@ -129,32 +228,23 @@ class Persona(pygame.sprite.Sprite):
             scale = 1.0 + math.sin(self.scale_pulse) * 0.05
             font_size = int(48 * scale)
 
-            # Use cached font or create new one
-            if font_size not in self._emoji_font_cache:
-                try:
-                    self._emoji_font_cache[font_size] = pygame.font.SysFont('segoeuiemoji,applesymbolsbook,notocoloremoji', font_size)
-                except:
-                    self._emoji_font_cache[font_size] = pygame.font.Font(None, font_size)
-
-            font = self._emoji_font_cache[font_size]
-            emoji_surf = font.render(self.emoji, True, (0, 0, 0))
-
             # Flip if facing left
-            if not self.facing_right and self.is_moving:
-                emoji_surf = pygame.transform.flip(emoji_surf, True, False)
+            flipped = not self.facing_right and self.is_moving
 
-            # Apply walking tilt
+            # Apply walking tilt (snapped to whole degrees so the few
+            # rotations in use are rendered once)
             if self.is_moving and self.walk_speed > 0.5:
-                tilt = math.sin(self.walk_frame * 4) * 5
-                emoji_surf = pygame.transform.rotate(emoji_surf, tilt)
+                tilt = round(math.sin(self.walk_frame * 4) * 5)
+                emoji_surf = _rotated_emoji(self.emoji, font_size, flipped, tilt)
+            else:
+                emoji_surf = _render_emoji(self.emoji, font_size, flipped)
 
             emoji_rect = emoji_surf.get_rect(center=(50, 35 + bob_offset))
             self.image.blit(emoji_surf, emoji_rect)
 
         # Draw name (cached since it never changes)
         if self._name_surface_cache is None:
-            font_name = pygame.font.Font(None, 16)
-            self._name_surface_cache = font_name.render(self.name, True, (50, 50, 50))
+            self._name_surface_cache = _name_font().render(self.name, True, (50, 50, 50))
         name_surf = self._name_surface_cache
         name_rect = name_surf.get_rect(center=(50, 65))
         self.image.blit(name_surf, name_rect)
@@ -256,6 +346,81 @@ class Persona(pygame.sprite.Sprite):
         return should_emit_glow
 
 
+# Shared speech bubble font, created on first use (pygame.font must be initialized)
+_bubble_font = None
+
+
+@lru_cache(maxsize=128)
+def _render_bubble(text):
+    """Render a speech bubble image, memoized by text.
+
+    Speech comes from small fixed phrase lists, so nearly every bubble
+    after the first few is a cache hit.
+
+    Args:
+        text: Text to display
+
+    Returns:
+        Bubble surface (shared between bubbles; do not draw onto it)
+    """
+    global _bubble_font
+    if _bubble_font is None:
+        _bubble_font = pygame.font.Font(None, 20)
+    font = _bubble_font
+
+    # Calculate bubble size (measuring text does not rasterize it)
+    padding = 15
+    width = min(200, font.size(text)[0] + padding * 2)
+    height = 45
+
+    # Create bubble surface with alpha
+    image = pygame.Surface((width, height + 15), pygame.SRCALPHA)
+
+    # Draw shadow
+    shadow_rect = pygame.Rect(3, 3, width, height)
+    pygame.draw.ellipse(image, (0, 0, 0, 80), shadow_rect)
+
+    # Draw white bubble
+    bubble_rect = pygame.Rect(0, 0, width, height)
+    pygame.draw.ellipse(image, (255, 255, 255, 255), bubble_rect)
+    pygame.draw.ellipse(image, (100, 100, 100, 255), bubble_rect, 2)
+
+    # Draw pointer (triangle)
+    pointer = [
+        (width // 2 - 8, height),
+        (width // 2 + 8, height),
+        (width // 2, height + 12)
+    ]
+    pygame.draw.polygon(image, (255, 255, 255, 255), pointer)
+    pygame.draw.lines(image, (100, 100, 100, 255), False,
+                     [pointer[0], pointer[2], pointer[1]], 2)
+
+    # Draw text (wrap if needed)
+    words = text.split()
+    lines = []
+    current_line = []
+    for word in words:
+        test_line = ' '.join(current_line + [word])
+        if font.size(test_line)[0] <= width - padding * 2:
+            current_line.append(word)
+        else:
+            if current_line:
+                lines.append(' '.join(current_line))
+            current_line = [word]
+    if current_line:
+        lines.append(' '.join(current_line))
+
+    # Blit text lines
+    y_offset = (height - len(lines) * 20) // 2
+    for i, line in enumerate(lines):
+        line_surf = font.render(line, True, (0, 0, 0))
+        line_rect = line_surf.get_rect(center=(width // 2, y_offset + i * 20 + 10))
+        image.blit(line_surf, line_rect)
+
+    # Match the display format so every frame's blit is a straight copy
+    return image.convert_alpha()
+
+
 class SpeechBubble(pygame.sprite.Sprite):
     """A speech bubble for personas."""
 
@@ -291,60 +456,7 @@ class SpeechBubble(pygame.sprite.Sprite):
 
     def render(self):
         """Render the speech bubble."""
-        # Create text surface
-        font = pygame.font.Font(None, 20)
-        text_surf = font.render(self.text, True, (0, 0, 0))
-
-        # Calculate bubble size
-        padding = 15
-        width = min(200, text_surf.get_width() + padding * 2)
-        height = 45
-
-        # Create bubble surface with alpha
-        self.image = pygame.Surface((width, height + 15), pygame.SRCALPHA)
-
-        # Draw shadow
-        shadow_rect = pygame.Rect(3, 3, width, height)
-        pygame.draw.ellipse(self.image, (0, 0, 0, 80), shadow_rect)
-
-        # Draw white bubble
-        bubble_rect = pygame.Rect(0, 0, width, height)
-        pygame.draw.ellipse(self.image, (255, 255, 255, 255), bubble_rect)
-        pygame.draw.ellipse(self.image, (100, 100, 100, 255), bubble_rect, 2)
-
-        # Draw pointer (triangle)
-        pointer = [
-            (width // 2 - 8, height),
-            (width // 2 + 8, height),
-            (width // 2, height + 12)
-        ]
-        pygame.draw.polygon(self.image, (255, 255, 255, 255), pointer)
-        pygame.draw.lines(self.image, (100, 100, 100, 255), False,
-                         [pointer[0], pointer[2], pointer[1]], 2)
-
-        # Draw text (wrap if needed)
-        words = self.text.split()
-        lines = []
-        current_line = []
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            test_surf = font.render(test_line, True, (0, 0, 0))
-            if test_surf.get_width() <= width - padding * 2:
-                current_line.append(word)
-            else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                current_line = [word]
-        if current_line:
-            lines.append(' '.join(current_line))
-
-        # Blit text lines
-        y_offset = (height - len(lines) * 20) // 2
-        for i, line in enumerate(lines):
-            line_surf = font.render(line, True, (0, 0, 0))
-            line_rect = line_surf.get_rect(center=(width // 2, y_offset + i * 20 + 10))
-            self.image.blit(line_surf, line_rect)
-
+        self.image = _render_bubble(self.text)
         self.rect = self.image.get_rect(center=self.pos)
 
 
@@ -366,6 +478,10 @@ class Door(pygame.sprite.Sprite):
         self.open_progress = 0.0  # 0.0 = closed, 1.0 = open
         self.target_progress = 0.0
 
+        # Rendered frames keyed by panel offset (None = closed); the
+        # animation only ever shows a few dozen distinct frames
+        self._frames = {}
+
         self.render()
 
     def open(self):
@@ -377,8 +493,25 @@ class Door(pygame.sprite.Sprite):
         self.target_progress = 0.0
 
     def render(self):
-        """Render the door."""
-        self.image = pygame.Surface((self.width + 50, self.height + 10), pygame.SRCALPHA)
+        """Show the door frame for the current open progress."""
+        door_offset = None if self.open_progress < 0.1 else int(self.open_progress * 35)
+        image = self._frames.get(door_offset)
+        if image is None:
+            image = self._render_frame(door_offset)
+            self._frames[door_offset] = image
+        self.image = image
+        self.rect = self.image.get_rect(topleft=self.pos)
+
+    def _render_frame(self, door_offset):
+        """Render one door frame.
+
+        Args:
+            door_offset: How far the open panel has slid, or None when closed
+
+        Returns:
+            Door surface
+        """
+        image = pygame.Surface((self.width + 50, self.height + 10), pygame.SRCALPHA)
 
         x_base = 5
         y_base = 5
@@ -386,43 +519,42 @@ class Door(pygame.sprite.Sprite):
         # Draw door frame
         frame_rect = pygame.Rect(x_base - 5, y_base - 5,
                                 self.width + 10, self.height + 10)
-        pygame.draw.rect(self.image, (101, 67, 33), frame_rect, 3)
+        pygame.draw.rect(image, (101, 67, 33), frame_rect, 3)
 
-        if self.open_progress < 0.1:
+        if door_offset is None:
             # Door closed
             door_rect = pygame.Rect(x_base, y_base, self.width, self.height)
-            pygame.draw.rect(self.image, (139, 90, 43), door_rect)
-            pygame.draw.rect(self.image, (101, 67, 33), door_rect, 2)
+            pygame.draw.rect(image, (139, 90, 43), door_rect)
+            pygame.draw.rect(image, (101, 67, 33), door_rect, 2)
 
             # Door panels
             panel1 = pygame.Rect(x_base + 5, y_base + 10,
                                self.width - 10, self.height // 2 - 15)
             panel2 = pygame.Rect(x_base + 5, y_base + self.height // 2 + 5,
                                self.width - 10, self.height // 2 - 15)
-            pygame.draw.rect(self.image, (101, 67, 33), panel1, 2)
-            pygame.draw.rect(self.image, (101, 67, 33), panel2, 2)
+            pygame.draw.rect(image, (101, 67, 33), panel1, 2)
+            pygame.draw.rect(image, (101, 67, 33), panel2, 2)
 
             # Door knob
             knob_pos = (x_base + self.width - 8, y_base + self.height // 2)
-            pygame.draw.circle(self.image, (255, 215, 0), knob_pos, 4)
+            pygame.draw.circle(image, (255, 215, 0), knob_pos, 4)
         else:
             # Door opening/open
             # Show dark interior
             interior_rect = pygame.Rect(x_base, y_base, self.width, self.height)
-            pygame.draw.rect(self.image, (30, 30, 30), interior_rect)
+            pygame.draw.rect(image, (30, 30, 30), interior_rect)
 
             # Door panel sliding to the side
-            door_offset = int(self.open_progress * 35)
             door_rect = pygame.Rect(x_base - door_offset, y_base,
                                    self.width, self.height)
-            pygame.draw.rect(self.image, (139, 90, 43), door_rect)
-            pygame.draw.rect(self.image, (101, 67, 33), door_rect, 2)
+            pygame.draw.rect(image, (139, 90, 43), door_rect)
+            pygame.draw.rect(image, (101, 67, 33), door_rect, 2)
 
             # Knob on open door
             knob_pos = (x_base - door_offset + 5, y_base + self.height // 2)
-            pygame.draw.circle(self.image, (255, 215, 0), knob_pos, 4)
+            pygame.draw.circle(image, (255, 215, 0), knob_pos, 4)
 
-        self.rect = self.image.get_rect(topleft=self.pos)
+        return image
 
     def update(self, dt):
         """Update door animation.
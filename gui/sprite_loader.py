@@ -1,7 +1,26 @@
 """Sprite sheet loader for character sprites."""
 import pygame
+import itertools
 import random
+import sys
+import numpy as np
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
+
+# Colorkey for sheets without partial transparency (must not be a sprite color)
+_SHEET_COLORKEY = (255, 0, 255)
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class Character:
+    """A character from the sprite sheet."""
+
+    row: int  # Sprite sheet row
+    idle: Optional[pygame.Surface] = None  # Idle sprite, extracted on first use
 
 
 class SpriteSheet:
@@ -16,7 +35,7 @@ class SpriteSheet:
             sprite_height: Height of each sprite in pixels
             margin: Margin between sprites in pixels
         """
-        self.sheet = pygame.image.load(filepath).convert_alpha()
+        self.sheet = self._load_sheet(filepath)
         self.sprite_width = sprite_width
         self.sprite_height = sprite_height
         self.margin = margin
@@ -26,29 +45,93 @@ class SpriteSheet:
         self.columns = (sheet_width + margin) // (sprite_width + margin)
         self.rows = (sheet_height + margin) // (sprite_height + margin)
 
-    def get_sprite(self, col, row, scale=1.0):
+        # Extracted sprites keyed by (col, row, scale, smooth)
+        self._sprite_cache = {}
+
+    def _load_sheet(self, filepath):
+        """Load the sheet image in the cheapest pixel format that preserves it.
+
+        Pixel-art sheets usually have only fully opaque or fully transparent
+        pixels. Those are converted to an opaque surface with a colorkey,
+        which blits without per-pixel alpha blending; sheets with partial
+        transparency keep per-pixel alpha. Sets self.uses_colorkey.
+
+        Args:
+            filepath: Path to sprite sheet image
+
+        Returns:
+            Display-format sheet surface
+        """
+        sheet = pygame.image.load(filepath).convert_alpha()
+        self.uses_colorkey = False
+
+        alpha = pygame.surfarray.pixels_alpha(sheet)
+        try:
+            binary_alpha = not ((alpha != 0) & (alpha != 255)).any()
+            opaque = alpha == 255
+        finally:
+            del alpha  # Unlock the surface
+        if not binary_alpha:
+            return sheet
+
+        # The colorkey must not collide with an opaque pixel's color
+        rgb = pygame.surfarray.pixels3d(sheet)
+        try:
+            key_used = (rgb[opaque] == _SHEET_COLORKEY).all(axis=1).any()
+        finally:
+            del rgb  # Unlock the surface
+        if key_used:
+            return sheet
+
+        keyed = pygame.Surface(sheet.get_size())
+        keyed.fill(_SHEET_COLORKEY)
+        keyed.blit(sheet, (0, 0))
+        keyed = keyed.convert()
+        keyed.set_colorkey(_SHEET_COLORKEY)
+        self.uses_colorkey = True
+        return keyed
+
+    def get_sprite(self, col, row, scale=1.0, smooth=False):
         """Extract a single sprite from the sheet.
 
+        Scaling is nearest-neighbor unless smooth is set, which keeps pixel
+        art crisp and is the cheaper path.
+
         Args:
             col: Column index (0-based)
             row: Row index (0-based)
             scale: Scale factor (1.0 = original size)
+            smooth: Use filtered (smoothscale) scaling instead
 
         Returns:
-            pygame.Surface with the sprite
+            pygame.Surface with the sprite. It is cached and shared between
+            callers (at scale 1.0 it is also a subsurface view sharing pixels
+            with the sheet), so callers that need to draw onto it must take
+            a .copy() first.
         """
+        key = (col, row, scale, smooth)
+        sprite = self._sprite_cache.get(key)
+        if sprite is not None:
+            return sprite
+
         # Account for margin between tiles
         x = col * (self.sprite_width + self.margin)
         y = row * (self.sprite_height + self.margin)
 
-        sprite = pygame.Surface((self.sprite_width, self.sprite_height), pygame.SRCALPHA)
-        sprite.blit(self.sheet, (0, 0), (x, y, self.sprite_width, self.sprite_height))
+        # Zero-copy view into the sheet
+        sprite = self.sheet.subsurface((x, y, self.sprite_width, self.sprite_height))
 
         if scale != 1.0:
-            new_width = int(self.sprite_width * scale)
-            new_height = int(self.sprite_height * scale)
-            sprite = pygame.transform.scale(sprite, (new_width, new_height))
-
+            if smooth:
+                sprite = pygame.transform.smoothscale_by(sprite, scale)
+            elif float(scale).is_integer():
+                sprite = pygame.transform.scale_by(sprite, int(scale))
+            else:
+                new_width = int(self.sprite_width * scale)
+                new_height = int(self.sprite_height * scale)
+                sprite = pygame.transform.scale(sprite, (new_width, new_height))
+
+        self._sprite_cache[key] = sprite
         return sprite
 
     def get_character_set(self, row, scale=1.0):
@@ -82,65 +165,67 @@ class CharacterSpriteManager:
         )
         self.scale = scale
 
-        # Pre-load diverse character sprites and validate they're not blank
-        self.character_pool = []
+        # Pool of diverse characters, skipping blank ones. Sprites are only
+        # extracted and scaled when a character is first handed out.
         rows_to_use = min(12, self.sprite_sheet.rows)  # Use up to 12 rows
 
-        for row in range(rows_to_use):
-            # Each row typically has the same character in different states
-            # We'll use the first sprite (idle/standing) from each row
-            sprite = self.sprite_sheet.get_sprite(0, row, scale)
-
-            # Validate sprite is not blank (check if it has non-transparent pixels)
-            if self._is_valid_sprite(sprite):
-                self.character_pool.append({
-                    'idle': sprite,
-                    'row': row,
-                })
+        # Each row typically has the same character in different states
+        # We'll use the first sprite (idle/standing) from each row
+        self.character_pool = [Character(row) for row in self._find_valid_rows(0, rows_to_use)]
 
         if not self.character_pool:
             raise ValueError("No valid character sprites found in sprite sheet")
 
         # Shuffle for variety
         random.shuffle(self.character_pool)
-        self.next_character_index = 0
+        self._character_cycle = itertools.cycle(self.character_pool)
 
-    def _is_valid_sprite(self, sprite):
-        """Check if sprite has visible pixels.
+    def _find_valid_rows(self, col, row_count):
+        """Find which rows have a visible (non-blank) sprite in a column.
+
+        All rows are classified in one pass over the unscaled sheet's alpha
+        plane rather than by inspecting each extracted sprite.
 
         Args:
-            sprite: pygame.Surface to validate
+            col: Column index (0-based)
+            row_count: Number of rows to check, starting from row 0
 
         Returns:
-            bool: True if sprite has non-transparent pixels
+            List of row indices whose sprite has non-transparent pixels
         """
-        # Check a few sample pixels to see if sprite has content
-        w, h = sprite.get_size()
-        sample_points = [
-            (w // 2, h // 2),  # Center
-            (w // 4, h // 2),  # Left-center
-            (3 * w // 4, h // 2),  # Right-center
-            (w // 2, h // 4),  # Top-center
-            (w // 2, 3 * h // 4),  # Bottom-center
-        ]
-
-        for x, y in sample_points:
-            if 0 <= x < w and 0 <= y < h:
-                pixel = sprite.get_at((x, y))
-                # Check if pixel has some alpha (not fully transparent)
-                if pixel.a > 50:  # Threshold for "visible"
-                    return True
-
-        return False
+        sheet = self.sprite_sheet
+        x = col * (sheet.sprite_width + sheet.margin)
+        stride = sheet.sprite_height + sheet.margin
+
+        # The alpha plane (indexed [x, y]): a locked view for per-pixel
+        # alpha sheets, a 0/255 copy for colorkeyed ones
+        if sheet.uses_colorkey:
+            alpha = pygame.surfarray.array_colorkey(sheet.sheet)
+        else:
+            alpha = pygame.surfarray.pixels_alpha(sheet.sheet)
+        try:
+            # Which pixel rows of this column have a visible pixel
+            visible_lines = (alpha[x:x + sheet.sprite_width] > 50).any(axis=0)  # Threshold for "visible"
+        finally:
+            del alpha  # Unlock the surface
+
+        # Split into one block per sprite row, dropping the margin lines
+        lines = np.zeros(row_count * stride, dtype=bool)
+        used = min(len(lines), len(visible_lines))
+        lines[:used] = visible_lines[:used]
+        valid = lines.reshape(row_count, stride)[:, :sheet.sprite_height].any(axis=1)
+
+        return np.flatnonzero(valid).tolist()
 
     def get_next_character(self):
         """Get the next character sprite from the pool.
 
         Returns:
-            Dict with 'idle' sprite and 'row' index
+            Character with its idle sprite and row index
         """
-        character = self.character_pool[self.next_character_index]
-        self.next_character_index = (self.next_character_index + 1) % len(self.character_pool)
+        character = next(self._character_cycle)
+        if character.idle is None:
+            character.idle = self.sprite_sheet.get_sprite(0, character.row, self.scale)
         return character
 
     def get_walking_frames(self, character_row, scale=None):
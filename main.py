@@ -1,7 +1,16 @@
 """Main entry point for Window Tracker (Windows & macOS)."""
+import importlib.util
 import sys
 import logging
 
+# Check for pygame (required for all platforms) before importing the GUI,
+# which needs it; find_spec checks without importing
+if importlib.util.find_spec("pygame") is None:
+    print("ERROR: pygame not found.")
+    print("\nPlease install pygame:")
+    print("pip install pygame")
+    sys.exit(1)
+
 from utils.logger import setup_logging
 from core.time_tracker import TimeTracker
 from core.personification import PersonificationManager
@@ -15,15 +24,6 @@ def main():
     setup_logging(log_to_file=True, log_to_console=True)
     logger = logging.getLogger(__name__)
 
-    # Check for pygame (required for all platforms)
-    try:
-        import pygame
-    except ImportError:
-        print("ERROR: pygame not found.")
-        print("\nPlease install pygame:")
-        print("pip install pygame")
-        return 1
-
     # Check platform support
     supported = get_supported_platforms()
     if not supported:
@@ -34,7 +34,7 @@ def main():
         print("  macOS:   pip install pyobjc-core pyobjc-framework-Cocoa pyobjc-framework-Quartz")
         return 1
 
-    logger.info(f"Starting Window Tracker on {supported[0]}")
+    logger.info("Starting Window Tracker on %s", supported[0])
 
     # Create tracker and personification manager
     try:
@@ -53,7 +53,7 @@ def main():
         view = PygameHouseView(tracker, personification_manager)
         view.run()
     except Exception as e:
-        logger.error(f"Error running application: {e}", exc_info=True)
+        logger.error("Error running application: %s", e, exc_info=True)
         return 1
     finally:
         tracker.stop()
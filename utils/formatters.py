@@ -1,5 +1,6 @@
 """Utility functions for formatting data for display."""
 from datetime import timedelta
+from functools import lru_cache
 
 
 def format_timedelta(td: timedelta) -> str:
@@ -14,24 +15,39 @@ def format_timedelta(td: timedelta) -> str:
     if not isinstance(td, timedelta):
         return "0s"
 
-    total_seconds = int(td.total_seconds())
+    return format_seconds(int(td.total_seconds()))
 
-    if total_seconds < 0:
-        return "0s"
 
-    if total_seconds == 0:
+@lru_cache(maxsize=4096)
+def format_seconds(total_seconds: int) -> str:
+    """Format a whole number of seconds into a human-readable string.
+
+    Memoized, since displayed times only change once per second.
+
+    Args:
+        total_seconds: Duration in whole seconds
+
+    Returns:
+        Formatted string like "1h 45m 30s" or "30s"
+    """
+    if total_seconds <= 0:
         return "0s"
 
     hours = total_seconds // 3600
     minutes = (total_seconds % 3600) // 60
     seconds = total_seconds % 60
 
-    parts = []
+    # One string per case, without building and joining a parts list
     if hours > 0:
-        parts.append(f"{hours}h")
+        if minutes > 0:
+            if seconds > 0:
+                return f"{hours}h {minutes}m {seconds}s"
+            return f"{hours}h {minutes}m"
+        if seconds > 0:
+            return f"{hours}h {seconds}s"
+        return f"{hours}h"
     if minutes > 0:
-        parts.append(f"{minutes}m")
-    if seconds > 0 or not parts:  # Always show seconds if nothing else
-        parts.append(f"{seconds}s")
-
-    return " ".join(parts)
+        if seconds > 0:
+            return f"{minutes}m {seconds}s"
+        return f"{minutes}m"
+    return f"{seconds}s"
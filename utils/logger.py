@@ -1,27 +1,41 @@
 """Logging configuration for the application."""
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 
 from config import LOG_FILE, LOG_LEVEL, LOG_FORMAT
 
+# Background thread that writes queued log records to the real handlers
+_listener = None
+
 
 def setup_logging(log_to_file: bool = True, log_to_console: bool = True):
     """Configure logging for the application.
 
+    Records are formatted and queued on the calling thread (by
+    QueueHandler.prepare) and written to the file/console handlers by a
+    background listener, so logging from the frame loop never blocks on I/O.
+
     Args:
         log_to_file: Whether to log to file
         log_to_console: Whether to log to console
     """
+    global _listener
+
     # Get root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, LOG_LEVEL))
 
-    # Clear any existing handlers
+    # Clear any existing handlers (and drain and close a previous listener's)
     root_logger.handlers.clear()
+    _stop_listener()
 
     # Create formatter
     formatter = logging.Formatter(LOG_FORMAT)
+    handlers = []
 
     # Add file handler
     if log_to_file:
@@ -29,7 +43,7 @@ def setup_logging(log_to_file: bool = True, log_to_console: bool = True):
             file_handler = logging.FileHandler(LOG_FILE, encoding='utf-8')
             file_handler.setLevel(getattr(logging, LOG_LEVEL))
             file_handler.setFormatter(formatter)
-            root_logger.addHandler(file_handler)
+            handlers.append(file_handler)
         except Exception as e:
             print(f"Warning: Could not create log file: {e}", file=sys.stderr)
 
@@ -38,11 +52,31 @@ def setup_logging(log_to_file: bool = True, log_to_console: bool = True):
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(getattr(logging, LOG_LEVEL))
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
+
+    # Route records through a queue to the listener thread
+    if handlers:
+        log_queue = queue.SimpleQueue()
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
 
     logging.info("Logging initialized")
 
 
+def _stop_listener():
+    """Flush queued records, stop the listener thread and close its handlers."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance.
 